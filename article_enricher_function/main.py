@@ -67,6 +67,8 @@ GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', 'aisports-scraping')
 VERTEX_AI_LOCATION = os.getenv('VERTEX_AI_LOCATION', 'us-central1')
 VERTEX_AI_MODEL = os.getenv('VERTEX_AI_MODEL', 'gemini-2.0-flash')
 
+JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 # File patterns that trigger this function
 TRIGGER_PATTERNS = [
     'singleton_complete_articles.json',
@@ -347,15 +349,16 @@ class ArticleEnricher:
             if keywords:
                 all_keywords.update(k.lower() for k in keywords if isinstance(k, str))
 
-        # Format keywords as tag list for the prompt
-        if all_keywords:
-            formatted_keywords = "- " + ", ".join(f"`{kw}`" for kw in sorted(all_keywords))
+        # Format keywords as tag list for the prompt (sorted once, reused for logging)
+        sorted_keywords = sorted(all_keywords)
+        if sorted_keywords:
+            formatted_keywords = "- " + ", ".join(f"`{kw}`" for kw in sorted_keywords)
         else:
             formatted_keywords = "- (none specified)"
 
         # Format the prompt with actual keywords
         formatted_prompt = ENRICHMENT_PROMPT.format(formatted_keywords=formatted_keywords)
-        logger.info(f"Formatted prompt with keywords: {sorted(all_keywords)}")
+        logger.info(f"Formatted prompt with keywords: {sorted_keywords}")
 
         # Group articles into batches of 10 for efficient processing
         batch_size = 10
@@ -416,7 +419,7 @@ class ArticleEnricher:
             GCS URI of uploaded file
         """
         # Create JSONL content
-        jsonl_content = '\n'.join(json.dumps(r, ensure_ascii=False) for r in requests)
+        jsonl_content = '\n'.join(JSONL_ENCODER.encode(r) for r in requests)
 
         # Upload path (include branch_type to prevent collisions)
         blob_path = f"{run_folder}/batch_enrichment/{source_type}/{branch_type}/request.jsonl"
@@ -551,6 +554,21 @@ class ArticleEnricher:
         }
 
 
+# Shared instance for warm invocations, created on first trigger
+_enricher = None
+
+
+def get_enricher() -> ArticleEnricher:
+    """Return the shared ArticleEnricher, creating it on first use."""
+    global _enricher
+    if _enricher is None:
+        enricher = ArticleEnricher()
+        if enricher.genai_client is None and ENVIRONMENT != 'local':
+            return enricher
+        _enricher = enricher
+    return _enricher
+
+
 def enrich_articles(event, context):
     """
     Cloud Function entry point.
@@ -573,7 +591,7 @@ def enrich_articles(event, context):
         return
 
     try:
-        enricher = ArticleEnricher()
+        enricher = get_enricher()
 
         if not enricher.genai_client and ENVIRONMENT != 'local':
             logger.error("Vertex AI client not available")
@@ -599,7 +617,7 @@ def main(request):
         if not gcs_path:
             return {"error": "gcs_path required"}, 400
 
-        enricher = ArticleEnricher()
+        enricher = get_enricher()
         result = enricher.process(gcs_path)
 
         return result, 200
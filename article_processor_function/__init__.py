@@ -7,12 +7,31 @@ similar articles and a single LLM call per group for processing.
 Replaces the two-stage batch_builder + result_merger architecture.
 """
 
-from .embedding_service import EmbeddingService
-from .grouping_service import GroupingService
-from .llm_processor import LLMProcessor
+import importlib
+
+# Re-exports are resolved on first access (PEP 562) so importing a single
+# submodule does not pull in numpy, genai and pydantic for all of them.
+_LAZY_EXPORTS = {
+    "EmbeddingService": ".embedding_service",
+    "GroupingService": ".grouping_service",
+    "LLMProcessor": ".llm_processor",
+}
 
 __all__ = [
     "EmbeddingService",
     "GroupingService",
     "LLMProcessor",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
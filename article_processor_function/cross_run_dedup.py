@@ -10,10 +10,13 @@ different content overlap characteristics across regions.
 Configurable via CROSS_RUN_DEDUP_DEPTH environment variable (default: 1 = same day only).
 """
 
+import base64
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Tuple, Set, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple, Optional
 import numpy as np
 from google.cloud import storage
 
@@ -22,10 +25,56 @@ logger = logging.getLogger(__name__)
 # Region-specific defaults (can be overridden via constructor)
 # TR: 0.85 - Turkish content needs higher threshold to avoid false positives on transfer news
 # EU: 0.9 - European content is more unique, requires stricter dedup
-DEFAULT_REGION_THRESHOLDS = {
+# Read-only, so deduplicators share it rather than each taking a copy
+DEFAULT_REGION_THRESHOLDS = MappingProxyType({
     'tr': 0.85,
     'eu': 0.9,
-}
+})
+
+# Embeddings are stored as one packed little-endian float32 column (base64)
+# rather than a JSON list of float lists: ~4x smaller and decoded with a
+# single np.frombuffer instead of parsing N*dim float literals.
+EMBEDDINGS_DTYPE = '<f4'
+EMBEDDINGS_ENCODING = 'float32-le-base64'
+
+# Previous-run embedding files are downloaded concurrently; GCS reads are
+# network-bound so a small pool overlaps round trips without hammering the API.
+EMBEDDING_DOWNLOAD_WORKERS = 8
+
+
+def encode_embeddings(embeddings: np.ndarray) -> str:
+    """
+    Pack an embeddings matrix into a base64 float32 string.
+
+    Args:
+        embeddings: Array of shape (n, dim)
+
+    Returns:
+        Base64-encoded little-endian float32 bytes (row-major)
+    """
+    packed = np.ascontiguousarray(embeddings, dtype=EMBEDDINGS_DTYPE)
+    return base64.b64encode(packed.tobytes()).decode('ascii')
+
+
+def decode_embeddings(data: Dict[str, Any]) -> np.ndarray:
+    """
+    Read embeddings from a saved embeddings file payload.
+
+    Supports both the packed column ("embeddings_b64") and the legacy
+    JSON list format ("embeddings") written by older runs.
+
+    Args:
+        data: Parsed embeddings JSON
+
+    Returns:
+        Array of shape (n, dim), or an empty array
+    """
+    encoded = data.get("embeddings_b64")
+    if encoded:
+        dim = data.get("embedding_dim") or 0
+        flat = np.frombuffer(base64.b64decode(encoded), dtype=EMBEDDINGS_DTYPE)
+        return flat.reshape(-1, dim) if dim else flat
+    return np.array(data.get("embeddings", []))
 
 
 class CrossRunDeduplicator:
@@ -61,7 +110,7 @@ class CrossRunDeduplicator:
         """
         self.storage_client = storage_client
         self.bucket_name = bucket_name
-        self.region_thresholds = region_thresholds or DEFAULT_REGION_THRESHOLDS.copy()
+        self.region_thresholds = region_thresholds or DEFAULT_REGION_THRESHOLDS
         self.dedup_depth = max(1, dedup_depth)  # Minimum 1 day
         # Fallback for unknown regions uses EU threshold (stricter)
         self.fallback_threshold = self.region_thresholds.get('eu', 0.9)
@@ -80,8 +129,8 @@ class CrossRunDeduplicator:
         Returns:
             Threshold for the region, or fallback threshold if region not configured
         """
-        if region and region.lower() in self.region_thresholds:
-            return self.region_thresholds[region.lower()]
+        if region:
+            return self.region_thresholds.get(region.lower(), self.fallback_threshold)
         return self.fallback_threshold
 
     def list_previous_embedding_files(
@@ -118,10 +167,14 @@ class CrossRunDeduplicator:
             check_date_str = check_date.strftime("%Y-%m-%d")
             prefix = f"ingestion/{check_date_str}/"
 
-            logger.debug(f"Checking embeddings for date: {check_date_str}")
+            logger.debug("Checking embeddings for date: %s", check_date_str)
 
-            # List all blobs under date prefix
-            blobs = bucket.list_blobs(prefix=prefix)
+            # List only embedding files under the date prefix (server-side glob),
+            # instead of every batch/prediction/output object written that day
+            blobs = bucket.list_blobs(
+                prefix=prefix,
+                match_glob=f"{prefix}*/embeddings/*_embeddings.json"
+            )
 
             for blob in blobs:
                 # Match pattern: ingestion/{date}/{HH-MM-SS}/embeddings/*.json
@@ -135,7 +188,7 @@ class CrossRunDeduplicator:
                         if check_date_str == date_str and run_id == current_run_id:
                             continue
                         embedding_files.append(path)
-                        logger.debug(f"Found previous embedding file: {path}")
+                        logger.debug("Found previous embedding file: %s", path)
 
         logger.info(
             f"Found {len(embedding_files)} embedding files from previous runs "
@@ -168,7 +221,7 @@ class CrossRunDeduplicator:
             urls = data.get("urls", [])  # May be empty for old embedding files
             titles = data.get("titles", [])  # May be empty for old embedding files
             content_lengths = data.get("content_lengths", [])  # May be empty
-            embeddings_list = data.get("embeddings", [])
+            embeddings_list = decode_embeddings(data)
 
             # If content_lengths available, filter out empty/short articles
             if content_lengths and len(content_lengths) == len(article_ids):
@@ -199,8 +252,8 @@ class CrossRunDeduplicator:
                 return filtered_ids, filtered_urls, filtered_titles, embeddings
 
             # No content_lengths - return all (backwards compatibility)
-            embeddings = np.array(embeddings_list)
-            logger.debug(f"Loaded {len(article_ids)} embeddings from {blob_path}")
+            embeddings = embeddings_list
+            logger.debug("Loaded %d embeddings from %s", len(article_ids), blob_path)
             return article_ids, urls if urls else [''] * len(article_ids), titles, embeddings
 
         except Exception as e:
@@ -236,8 +289,12 @@ class CrossRunDeduplicator:
         all_titles = []
         all_embeddings = []
 
-        for blob_path in embedding_files:
-            article_ids, urls, titles, embeddings = self.load_embeddings_from_gcs(blob_path)
+        workers = min(EMBEDDING_DOWNLOAD_WORKERS, len(embedding_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() preserves file order, so the combined arrays stay aligned
+            loaded = list(executor.map(self.load_embeddings_from_gcs, embedding_files))
+
+        for article_ids, urls, titles, embeddings in loaded:
             if len(article_ids) > 0 and embeddings.size > 0:
                 all_article_ids.extend(article_ids)
                 all_urls.extend(urls)
@@ -362,8 +419,8 @@ class CrossRunDeduplicator:
                 })
                 region_stats[region_key]['dropped'] += 1
                 logger.debug(
-                    f"Dropping article (sim={similarity:.3f}, threshold={threshold}, region={region}): "
-                    f"{article.get('title', '')[:50]}"
+                    "Dropping article (sim=%.3f, threshold=%s, region=%s): %s",
+                    similarity, threshold, region, article.get('title', '')[:50]
                 )
             else:
                 kept_articles.append(article)
@@ -381,8 +438,8 @@ class CrossRunDeduplicator:
         # Log per-region stats
         for region, stats in region_stats.items():
             logger.info(
-                f"  Region '{region}': threshold={stats['threshold']}, "
-                f"kept={stats['kept']}, dropped={stats['dropped']}"
+                "  Region '%s': threshold=%s, kept=%d, dropped=%d",
+                region, stats['threshold'], stats['kept'], stats['dropped']
             )
 
         return kept_articles, kept_embeddings_array, dropped_log
@@ -413,7 +470,8 @@ class CrossRunDeduplicator:
         data = {
             "article_ids": article_ids,
             "urls": urls,
-            "embeddings": embeddings.tolist(),
+            "embeddings_b64": encode_embeddings(embeddings),
+            "embedding_encoding": EMBEDDINGS_ENCODING,
             "count": len(article_ids),
             "embedding_dim": embeddings.shape[1] if embeddings.ndim > 1 else 0,
             "created_at": datetime.now(timezone.utc).isoformat()
@@ -6,6 +6,7 @@ These embeddings are used to compute similarity and group related articles.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 import numpy as np
@@ -25,6 +26,7 @@ class EmbeddingService:
     BATCH_SIZE = 40  # Reduced from 100 to handle Turkish text's higher token density (~2.3x)
     MODEL = "text-embedding-004"
     MAX_BODY_LENGTH = 500  # First 500 characters of body to embed
+    MAX_CONCURRENT_BATCHES = 4  # Bounded to stay under Vertex AI embedding quota
 
     def __init__(self, client: genai.Client):
         """
@@ -34,6 +36,9 @@ class EmbeddingService:
             client: Initialized genai.Client with Vertex AI credentials
         """
         self.client = client
+        # genai config types are pydantic models; build and validate once
+        # instead of per embed_content call
+        self.embed_config = types.EmbedContentConfig(task_type="SEMANTIC_SIMILARITY")
         logger.info(f"EmbeddingService initialized with model: {self.MODEL}")
 
     def _prepare_text(self, article: dict) -> str:
@@ -72,40 +77,51 @@ class EmbeddingService:
             logger.warning("No articles provided for embedding generation")
             return np.array([])
 
-        # Prepare texts for embedding
+        # Prepare texts for embedding. Identical texts (the same story
+        # fetched twice) are embedded once and mapped back to every article.
         texts = [self._prepare_text(article) for article in articles]
+        text_index = {}
+        indices = [text_index.setdefault(text, len(text_index)) for text in texts]
+        unique_texts = list(text_index)
 
-        logger.info(f"Generating embeddings for {len(texts)} articles")
+        logger.info(f"Generating embeddings for {len(texts)} articles ({len(unique_texts)} unique texts)")
 
-        embeddings = []
-
-        # Process in batches
-        for i in range(0, len(texts), self.BATCH_SIZE):
-            batch = texts[i:i + self.BATCH_SIZE]
-            batch_num = i // self.BATCH_SIZE + 1
-            total_batches = (len(texts) + self.BATCH_SIZE - 1) // self.BATCH_SIZE
+        batches = [
+            unique_texts[i:i + self.BATCH_SIZE]
+            for i in range(0, len(unique_texts), self.BATCH_SIZE)
+        ]
+        total_batches = len(batches)
 
+        def embed_batch(batch_num: int, batch: List[str]) -> List[List[float]]:
             logger.info(f"Processing embedding batch {batch_num}/{total_batches} ({len(batch)} articles)")
 
             try:
                 response = self.client.models.embed_content(
                     model=self.MODEL,
                     contents=batch,
-                    config=types.EmbedContentConfig(
-                        task_type="SEMANTIC_SIMILARITY"
-                    )
+                    config=self.embed_config
                 )
 
                 # Extract embedding values
                 batch_embeddings = [e.values for e in response.embeddings]
-                embeddings.extend(batch_embeddings)
 
-                logger.debug(f"Batch {batch_num} completed: {len(batch_embeddings)} embeddings")
+                logger.debug("Batch %d completed: %d embeddings", batch_num, len(batch_embeddings))
+                return batch_embeddings
 
             except Exception as e:
                 logger.error(f"Error generating embeddings for batch {batch_num}: {e}")
                 raise
 
+        # Batches are independent network calls; run a bounded number at once.
+        # map() yields in submission order, so rows stay aligned with texts.
+        embeddings = []
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_BATCHES, total_batches)) as executor:
+            for batch_embeddings in executor.map(embed_batch, range(1, total_batches + 1), batches):
+                embeddings.extend(batch_embeddings)
+
+        if len(unique_texts) < len(texts):
+            embeddings = [embeddings[i] for i in indices]
+
         result = np.array(embeddings)
         logger.info(f"Generated embeddings with shape: {result.shape}")
 
@@ -125,9 +141,7 @@ class EmbeddingService:
             response = self.client.models.embed_content(
                 model=self.MODEL,
                 contents=[text],
-                config=types.EmbedContentConfig(
-                    task_type="SEMANTIC_SIMILARITY"
-                )
+                config=self.embed_config
             )
 
             return np.array(response.embeddings[0].values)
@@ -7,17 +7,17 @@ Uses Union-Find (Disjoint Set) algorithm for efficient group formation.
 
 import logging
 from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Set
+from dataclasses import dataclass
+from typing import List, Dict, Tuple
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArticleGroup:
-    """Represents a group of similar articles."""
+    """Represents a group of similar articles (built once, never mutated)."""
     group_id: int
     article_indices: List[int]
     max_similarity: float = 0.0
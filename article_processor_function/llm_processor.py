@@ -4,28 +4,77 @@ LLM Processor for Article Processing
 Handles Vertex AI batch job submission and response parsing for article group processing.
 """
 
+import io
 import json
 import logging
 import os
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Tuple
 
 from google.cloud import storage
 from google import genai
 from google.genai.types import CreateBatchJobConfig
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 from .grouping_service import ArticleGroup
 from .models import (
     VERTEX_AI_RESPONSE_SCHEMA,
     article_to_group_input,
-    parse_llm_response,
-    GroupProcessingResult,
     ProcessedArticle,
 )
 
 logger = logging.getLogger(__name__)
 
+JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Prompt file contents keyed by path -> (st_mtime_ns, text); warm instances
+# reuse the text until the file changes
+_PROMPT_CACHE: Dict[str, Tuple[int, str]] = {}
+
+
+def read_text_cached(path: Path) -> str:
+    """
+    Read a UTF-8 text file, reusing the previous read while its mtime is unchanged.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File contents
+    """
+    key = str(path)
+    mtime_ns = os.stat(key).st_mtime_ns
+    cached = _PROMPT_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with open(key, 'r', encoding='utf-8') as f:
+        content = f.read()
+    _PROMPT_CACHE[key] = (mtime_ns, content)
+    return content
+
+
+def dumps_pretty(data: Any) -> str:
+    """
+    Serialize data as 2-space indented JSON for prompts.
+
+    Uses orjson's C encoder when available, falling back to
+    json.dumps(data, ensure_ascii=False, indent=2). Layout matches, but
+    orjson may format some floats differently (1e-05 becomes 0.00001).
+    OPT_SERIALIZE_NUMPY is needed because GroupingService similarities
+    are numpy.float64, which json accepts as a float subclass.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
 
 class LLMProcessor:
     """
@@ -73,8 +122,7 @@ class LLMProcessor:
 
         for prompt_path in prompt_paths:
             if prompt_path.exists():
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = read_text_cached(prompt_path)
                 logger.info(f"Loaded prompt template from {prompt_path}")
                 return content
 
@@ -118,7 +166,7 @@ class LLMProcessor:
                             "role": "user",
                             "parts": [
                                 {"text": prompt_template},
-                                {"text": f"\n\n## ARTICLE GROUP DATA\n\n```json\n{json.dumps(group_input, ensure_ascii=False, indent=2)}\n```"}
+                                {"text": f"\n\n## ARTICLE GROUP DATA\n\n```json\n{dumps_pretty(group_input)}\n```"}
                             ]
                         }
                     ],
@@ -190,7 +238,7 @@ class LLMProcessor:
                             "role": "user",
                             "parts": [
                                 {"text": prompt_template},
-                                {"text": f"\n\n## BATCH OF SINGLETON ARTICLES\n\nProcess each group independently.\n\n```json\n{json.dumps(combined_input, ensure_ascii=False, indent=2)}\n```"}
+                                {"text": f"\n\n## BATCH OF SINGLETON ARTICLES\n\nProcess each group independently.\n\n```json\n{dumps_pretty(combined_input)}\n```"}
                             ]
                         }
                     ],
@@ -227,24 +275,19 @@ class LLMProcessor:
         Returns:
             GCS URI of the uploaded file
         """
-        # Write to local temp file first
-        local_path = Path("/tmp") / f"batch_request_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.jsonl"
-
-        with open(local_path, 'w', encoding='utf-8') as f:
-            for request in batch_requests:
-                f.write(json.dumps(request, ensure_ascii=False) + '\n')
+        # Serialize in memory and upload in one call (no /tmp round trip)
+        jsonl_content = ''.join(
+            JSONL_ENCODER.encode(request) + '\n' for request in batch_requests
+        )
 
         # Upload to GCS
         bucket = self.storage_client.bucket(self.bucket_name)
         blob = bucket.blob(output_path)
-        blob.upload_from_filename(str(local_path), content_type='application/x-ndjson')
+        blob.upload_from_string(jsonl_content, content_type='application/x-ndjson')
 
         gcs_uri = f"gs://{self.bucket_name}/{output_path}"
         logger.info(f"Uploaded batch request to {gcs_uri}")
 
-        # Clean up local file
-        local_path.unlink()
-
         return gcs_uri
 
     def submit_batch_job(
@@ -310,18 +353,23 @@ class LLMProcessor:
 
         bucket = self.storage_client.bucket(bucket_name)
         blob = bucket.blob(blob_path)
-        content = blob.download_as_text()
+        content = blob.download_as_bytes()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+        # error handling below covers both parsers
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
         # Parse JSONL results
         all_articles = []
         group_map = {g.group_id: g for g in groups}
 
-        for line_num, line in enumerate(content.strip().split('\n')):
+        # Lines are read lazily from the downloaded bytes rather than via
+        # strip().splitlines(), which would copy the whole file twice more
+        for line_num, line in enumerate(io.BytesIO(content)):
             if not line.strip():
                 continue
 
             try:
-                prediction = json.loads(line)
+                prediction = loads(line)
 
                 # Extract response text
                 candidates = prediction.get('response', {}).get('candidates', [])
@@ -335,7 +383,7 @@ class LLMProcessor:
                     continue
 
                 # Parse the response
-                response_data = json.loads(response_text)
+                response_data = loads(response_text)
 
                 # Extract articles and add metadata
                 for article in response_data.get('output_articles', []):
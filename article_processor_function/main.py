@@ -31,7 +31,7 @@ from google.cloud import storage
 from google import genai
 
 from embedding_service import EmbeddingService
-from grouping_service import GroupingService, ArticleGroup
+from grouping_service import GroupingService
 from cross_run_dedup import CrossRunDeduplicator
 
 # Enhanced logging configuration
@@ -296,13 +296,14 @@ class ArticleProcessor:
 
         return filtered, num_removed
 
-    def save_json_to_gcs(self, data: Any, blob_path: str) -> str:
+    def save_json_to_gcs(self, data: Any, blob_path: str, pretty: bool = False) -> str:
         """
         Save JSON data to GCS.
 
         Args:
             data: Data to serialize as JSON
             blob_path: GCS blob path
+            pretty: Indent output (default compact, since article files are machine-read)
 
         Returns:
             GCS URI of saved file
@@ -310,7 +311,7 @@ class ArticleProcessor:
         bucket = self.storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(blob_path)
         blob.upload_from_string(
-            json.dumps(data, ensure_ascii=False, indent=2),
+            json.dumps(data, ensure_ascii=False, indent=2 if pretty else None),
             content_type='application/json'
         )
 
@@ -390,7 +391,7 @@ class ArticleProcessor:
                     "eu": CROSS_RUN_DEDUP_THRESHOLD_EU
                 },
                 "created_at": datetime.now(timezone.utc).isoformat()
-            }, dedup_log_path)
+            }, dedup_log_path, pretty=True)
 
         if not articles:
             return {
@@ -411,13 +412,14 @@ class ArticleProcessor:
         logger.info(f"Formed {len(singletons)} singletons, {len(multi_groups)} groups")
 
         # Step 7: Build output files
-        # Normalize article fields for downstream compatibility
+        # Normalize article fields for downstream compatibility.
+        # Each article index belongs to exactly one group and `articles` is not
+        # read again after this step, so normalize in place instead of copying.
+        # download_articles already guarantees article_id, original_url and
+        # region on every article, so those are not re-checked here.
         def normalize_article(article: Dict, metadata: Dict) -> Dict:
-            """Normalize raw article to ProcessedArticle-compatible format."""
-            normalized = article.copy()
-            # Field name normalization (raw -> ProcessedArticle)
-            if 'url' in normalized and 'original_url' not in normalized:
-                normalized['original_url'] = normalized.pop('url')
+            """Normalize raw article to ProcessedArticle-compatible format (in place)."""
+            normalized = article
             # Normalize published_at -> publish_date (scraper uses published_at, standard is publish_date)
             if 'published_at' in normalized and 'publish_date' not in normalized:
                 normalized['publish_date'] = normalized.pop('published_at')
@@ -439,10 +441,6 @@ class ArticleProcessor:
             normalized.setdefault('x_post', '')
             # Preserve keywords that matched this article (for UI highlighting)
             normalized.setdefault('keywords_used', [])
-            # Derive region from language if not set: tr -> tr, everything else -> eu
-            if 'region' not in normalized or not normalized.get('region'):
-                lang = normalized.get('language', '')
-                normalized['region'] = 'tr' if lang == 'tr' else 'eu'
             # Preserve source_type from article or infer from extraction_method
             if 'source_type' not in normalized:
                 extraction_method = normalized.get('extraction_method', '')
@@ -525,13 +523,28 @@ class ArticleProcessor:
         }
 
         metadata_path = f"{run_folder}/processing_metadata_{source_type}.json"
-        self.save_json_to_gcs(metadata, metadata_path)
+        self.save_json_to_gcs(metadata, metadata_path, pretty=True)
 
         logger.info(f"Processing complete: {len(singleton_articles)} singletons, {len(multi_groups)} groups")
 
         return metadata
 
 
+# Shared instance for warm invocations, created on first trigger
+_processor = None
+
+
+def get_processor() -> ArticleProcessor:
+    """Return the shared ArticleProcessor, creating it on first use."""
+    global _processor
+    if _processor is None:
+        processor = ArticleProcessor()
+        if processor.genai_client is None and ENVIRONMENT != 'local':
+            return processor
+        _processor = processor
+    return _processor
+
+
 def process_articles(event, context):
     """
     Cloud Function entry point.
@@ -562,7 +575,7 @@ def process_articles(event, context):
         return
 
     try:
-        processor = ArticleProcessor()
+        processor = get_processor()
 
         if not processor.genai_client and ENVIRONMENT != 'local':
             logger.error("Vertex AI client not available")
@@ -602,7 +615,7 @@ def main(request):
         if not gcs_path:
             return {"error": "gcs_path required"}, 400
 
-        processor = ArticleProcessor()
+        processor = get_processor()
         result = processor.process(gcs_path)
 
         return result, 200
@@ -4,10 +4,26 @@ Data Models for Article Processor Function
 Pydantic models and Vertex AI response schemas for the unified article processing pipeline.
 """
 
+import json
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
+__all__ = [
+    "RawArticle",
+    "ArticleGroupInput",
+    "CategoryAssignment",
+    "KeyEntities",
+    "GroupingMetadata",
+    "ProcessedArticle",
+    "GroupProcessingResult",
+    "ProcessingSummary",
+    "ProcessingOutput",
+    "VERTEX_AI_RESPONSE_SCHEMA",
+    "article_to_group_input",
+    "parse_llm_response",
+]
+
 
 # ============================================================================
 # Input Models
@@ -31,7 +47,9 @@ class ArticleGroupInput(BaseModel):
     group_id: int
     group_size: int
     max_similarity: float
-    articles: List[Dict[str, Any]]
+    # Article dicts are passed through to the prompt as-is; List[Any] skips
+    # pydantic walking every key of every article on validation.
+    articles: List[Any]
 
 
 # ============================================================================
@@ -286,8 +304,6 @@ def parse_llm_response(response_text: str, group_id: int, group_size: int, max_s
     Returns:
         GroupProcessingResult with metadata added
     """
-    import json
-
     data = json.loads(response_text)
 
     # Add grouping metadata to each output article
@@ -11,13 +11,21 @@ Endpoints:
 """
 
 import os
+import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any
-from fastapi import FastAPI, HTTPException, Header, Query
+from typing import Dict, Any, Optional
+from fastapi import FastAPI, HTTPException, Header, Query, Response
 from playwright.async_api import async_playwright
 from google.cloud import secretmanager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -41,6 +49,11 @@ DEFAULT_SCROLL_COUNT = 5
 DEFAULT_SCROLL_WAIT_MS = 1500
 DEFAULT_TIMEOUT_MS = 60000
 
+# Subresources that never change the returned HTML; aborting them cuts page
+# weight and lets "networkidle" settle sooner
+BLOCK_HEAVY_RESOURCES = os.getenv('BLOCK_HEAVY_RESOURCES', 'true').lower() == 'true'
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
 # Initialize Secret Manager client
 if ENVIRONMENT != 'local':
     secret_client = secretmanager.SecretManagerServiceClient()
@@ -51,6 +64,13 @@ else:
 CACHE: Dict[str, Dict[str, Any]] = {}
 CONFIG_CACHE_TTL_SECONDS = 5 * 60  # 5 minutes
 
+# Rendered pages are cached by URL alone: a render with more scrolls contains
+# everything a render with fewer scrolls would, so it can serve both requests.
+# Kept apart from CACHE, which validate_api_key writes from worker threads.
+RENDER_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+RENDER_CACHE_TTL_SECONDS = 10 * 60  # 10 minutes
+RENDER_CACHE_MAX_ENTRIES = 32  # Rendered HTML can be several MB per page
+
 
 def access_secret(secret_id: str, version_id: str = "latest") -> str:
     """Access a secret from Google Cloud Secret Manager."""
@@ -89,6 +109,74 @@ def validate_api_key(api_key: str) -> bool:
     return api_key == expected_key
 
 
+def get_cached_render(url: str, scrolls: int) -> Optional[str]:
+    """
+    Get cached rendered HTML for a URL if still valid.
+
+    Args:
+        url: Rendered URL
+        scrolls: Requested scroll iterations
+
+    Returns:
+        Cached HTML if a fresh render with at least `scrolls` scrolls exists, else None
+    """
+    entry = RENDER_CACHE.get(url)
+    if not entry:
+        return None
+
+    if datetime.now().timestamp() - entry['timestamp'] >= RENDER_CACHE_TTL_SECONDS:
+        RENDER_CACHE.pop(url, None)
+        return None
+
+    if entry['scrolls'] < scrolls:
+        return None
+
+    return entry['data']
+
+
+def set_cached_render(url: str, scrolls: int, content: str) -> None:
+    """Cache rendered HTML for a URL, evicting the oldest renders beyond the limit."""
+    RENDER_CACHE.pop(url, None)
+    RENDER_CACHE[url] = {
+        'data': content,
+        'scrolls': scrolls,
+        'timestamp': datetime.now().timestamp()
+    }
+
+    while len(RENDER_CACHE) > RENDER_CACHE_MAX_ENTRIES:
+        RENDER_CACHE.popitem(last=False)
+
+
+async def block_heavy_resources(route) -> None:
+    """Abort image/media/font requests; let everything else through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def render_response(html: str, url: str, scrolls: int):
+    """
+    Build the /render payload.
+
+    Rendered pages run to megabytes of HTML; encoding them with orjson
+    straight to bytes skips FastAPI's jsonable_encoder pass and the slower
+    stdlib escaping of the html string.
+
+    Args:
+        html: Rendered page HTML
+        url: The rendered URL
+        scrolls: Scroll iterations used
+
+    Returns:
+        A JSON Response, or the plain dict when orjson is not installed
+    """
+    payload = {"html": html, "url": url, "scrolls": scrolls}
+    if ORJSON_AVAILABLE:
+        return Response(content=orjson.dumps(payload), media_type="application/json")
+    return payload
+
+
 @app.get("/")
 async def root():
     """Root endpoint - returns 403 Forbidden."""
@@ -118,11 +206,17 @@ async def render(
     Returns:
         JSON with rendered HTML content
     """
-    # Authentication check (MANDATORY)
-    if not validate_api_key(x_api_key):
+    # Authentication check (MANDATORY). Run off the event loop: a cache miss
+    # is a blocking Secret Manager call that would stall concurrent renders.
+    if not await asyncio.to_thread(validate_api_key, x_api_key):
         logger.warning("Invalid or missing API key for URL: %s", url)
         raise HTTPException(status_code=403, detail="Forbidden")
 
+    cached = get_cached_render(url, scrolls)
+    if cached is not None:
+        logger.info("Serving cached render for %s (scrolls=%d)", url, scrolls)
+        return render_response(cached, url, scrolls)
+
     logger.info("Rendering URL: %s (scrolls=%d)", url, scrolls)
 
     async with async_playwright() as p:
@@ -136,6 +230,8 @@ async def render(
                 user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
                 viewport={"width": 1920, "height": 1080}
             )
+            if BLOCK_HEAVY_RESOURCES:
+                await context.route("**/*", block_heavy_resources)
             page = await context.new_page()
 
             # Navigate to URL
@@ -156,7 +252,8 @@ async def render(
             content = await page.content()
 
             logger.info("Successfully rendered %s (content length: %d)", url, len(content))
-            return {"html": content, "url": url, "scrolls": scrolls}
+            set_cached_render(url, scrolls, content)
+            return render_response(content, url, scrolls)
 
         except Exception as e:
             logger.error("Error rendering %s: %s", url, str(e))
@@ -319,7 +319,7 @@ The data contains sports news articles that need to be processed according to th
                 JobState.JOB_STATE_PAUSED,
             }
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             logger.info(f"[MONITOR] Monitoring batch job: {job_name}")
             logger.info(f"  Checking every {polling_interval} seconds...")
             
@@ -328,14 +328,14 @@ The data contains sports news articles that need to be processed according to th
             
             # Follow Google's pattern for monitoring
             while job.state not in completed_states:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 logger.info(f"  Job state: {job.state} (elapsed: {elapsed:.1f}s)")
                 
                 time.sleep(polling_interval)
                 job = self.client.batches.get(name=job_name)
             
             # Final status
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.info(f"[SUCCESS] Job completed with state: {job.state}")
             
             # Return comprehensive job information
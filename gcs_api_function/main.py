@@ -21,15 +21,27 @@ import sys
 import json
 import logging
 import hashlib
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Callable, Collection, Dict, List, Any, Optional, Tuple
 import functions_framework
-from flask import Request, jsonify
+from flask import Request
 
 from google.cloud import storage, secretmanager, pubsub_v1
 from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # Logging Configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -54,6 +66,10 @@ USER_PREFERENCES_FOLDER = 'config/user_preferences/'
 SCRAPING_TOPIC = os.getenv('SCRAPING_REQUEST_TOPIC', 'scraping-requests')
 NEWS_API_TOPIC = os.getenv('NEWS_API_REQUEST_TOPIC', 'news-api-requests')
 
+# Default /trigger/news-api keywords; a tuple is shared across requests and
+# serializes to the same JSON array as a list
+DEFAULT_NEWS_API_KEYWORDS = ('fenerbahce', 'galatasaray', 'tedesco')
+
 # Fallback allowed emails
 FALLBACK_ALLOWED_EMAILS = ['oktay.burak.ertas@gmail.com']
 
@@ -70,7 +86,33 @@ else:
 # In-memory cache with TTL
 CACHE: Dict[str, Dict[str, Any]] = {}
 CACHE_TTL_SECONDS = 10 * 60  # 10 minutes
+PAST_DATE_CACHE_TTL_SECONDS = 60 * 60  # 1 hour; earlier dates only get late batch results
 CONFIG_CACHE_TTL_SECONDS = 5 * 60  # 5 minutes
+ARTICLE_CACHE_MAX_DATES = 31  # Each cached date holds a full day of articles
+
+# Parsed blob cache keyed by (blob name, generation); GCS objects are immutable
+# per generation, so entries never go stale - only evicted when over capacity.
+# Values are (data, blob size) so the cache is bounded by the stored JSON size
+# as well as entry count; parsed objects take several times their JSON size,
+# so the byte budget stays well under the function's 512Mi memory limit.
+BLOB_JSON_CACHE: "OrderedDict[tuple, Tuple[Any, int]]" = OrderedDict()
+BLOB_JSON_CACHE_MAX_ENTRIES = 256
+BLOB_JSON_CACHE_MAX_BYTES = 32 * 1024 * 1024
+BLOB_JSON_CACHE_LOCK = threading.Lock()
+
+# Built /articles?region=diff responses keyed by the (name, generation) pairs of
+# the diff files they were built from; any new or rewritten file changes the key
+DIFF_RESPONSE_CACHE: "OrderedDict[tuple, List[Dict[str, Any]]]" = OrderedDict()
+DIFF_RESPONSE_CACHE_MAX_ENTRIES = 16
+DIFF_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Concurrent GCS downloads (downloads are network-bound and release the GIL).
+# One pool shared across requests: warm instances reuse its threads instead of
+# starting new ones per listing, and total download threads stay bounded.
+BLOB_DOWNLOAD_WORKERS = 8
+BLOB_DOWNLOAD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=BLOB_DOWNLOAD_WORKERS, thread_name_prefix='blob-download'
+)
 
 
 # =============================================================================
@@ -82,6 +124,12 @@ def hash_email(email: str) -> str:
     return hashlib.sha256(email.lower().encode()).hexdigest()[:16]
 
 
+@functools.lru_cache(maxsize=1024)
+def get_user_preferences_path(email: str) -> str:
+    """Get the GCS blob path of a user's preferences (memoized per email)."""
+    return f'{USER_PREFERENCES_FOLDER}{hash_email(email)}/preferences.json'
+
+
 def access_secret(secret_id: str, version_id: str = "latest") -> str:
     """Access a secret from Google Cloud Secret Manager."""
     if ENVIRONMENT == 'local':
@@ -96,6 +144,32 @@ def access_secret(secret_id: str, version_id: str = "latest") -> str:
         return ''
 
 
+def parse_json_bytes(raw: bytes) -> Any:
+    """Parse a downloaded JSON payload straight from bytes (orjson when available)."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def download_json_if_exists(blob) -> Optional[Any]:
+    """
+    Download and parse a JSON blob in a single request.
+
+    Replaces the blob.exists() + download pair (two GCS round trips) with
+    one download that treats 404 as "missing".
+
+    Args:
+        blob: GCS blob
+
+    Returns:
+        Parsed JSON, or None if the blob does not exist
+    """
+    try:
+        return parse_json_bytes(blob.download_as_bytes())
+    except Exception as e:
+        if getattr(e, 'code', None) == 404:
+            return None
+        raise
+
+
 def validate_api_key(request: Request) -> bool:
     """Validate the API key from request headers."""
     api_key = request.headers.get('X-API-Key')
@@ -106,12 +180,12 @@ def validate_api_key(request: Request) -> bool:
     cache_key = 'api_key'
     cached = CACHE.get(cache_key)
     
-    if cached and (datetime.now().timestamp() - cached['timestamp'] < CONFIG_CACHE_TTL_SECONDS):
+    if cached and (time.monotonic() - cached['timestamp'] < CONFIG_CACHE_TTL_SECONDS):
         expected_key = cached['data']
     else:
         expected_key = access_secret(API_KEY_SECRET_ID)
         if expected_key:
-            CACHE[cache_key] = {'data': expected_key, 'timestamp': datetime.now().timestamp()}
+            CACHE[cache_key] = {'data': expected_key, 'timestamp': time.monotonic()}
 
     if not expected_key:
         logger.error("Could not retrieve API key from Secret Manager")
@@ -151,20 +225,20 @@ def load_allowed_users() -> List[str]:
     cache_key = 'allowed_users'
     cached = CACHE.get(cache_key)
     
-    if cached and (datetime.now().timestamp() - cached['timestamp'] < CONFIG_CACHE_TTL_SECONDS):
+    if cached and (time.monotonic() - cached['timestamp'] < CONFIG_CACHE_TTL_SECONDS):
         return cached['data']
     
     try:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(f'{CONFIG_FOLDER}allowed_users.json')
         
-        if not blob.exists():
+        content = download_json_if_exists(blob)
+        if content is None:
             return FALLBACK_ALLOWED_EMAILS
         
-        content = json.loads(blob.download_as_text())
         users = content.get('allowed_users', FALLBACK_ALLOWED_EMAILS)
         
-        CACHE[cache_key] = {'data': users, 'timestamp': datetime.now().timestamp()}
+        CACHE[cache_key] = {'data': users, 'timestamp': time.monotonic()}
         return users
     except Exception as e:
         logger.error(f"Error loading allowed users: {e}")
@@ -176,20 +250,20 @@ def load_admin_users() -> List[str]:
     cache_key = 'admin_users'
     cached = CACHE.get(cache_key)
     
-    if cached and (datetime.now().timestamp() - cached['timestamp'] < CONFIG_CACHE_TTL_SECONDS):
+    if cached and (time.monotonic() - cached['timestamp'] < CONFIG_CACHE_TTL_SECONDS):
         return cached['data']
     
     try:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(f'{CONFIG_FOLDER}admin_users.json')
         
-        if not blob.exists():
+        content = download_json_if_exists(blob)
+        if content is None:
             return []
         
-        content = json.loads(blob.download_as_text())
         admins = content.get('admin_users', [])
         
-        CACHE[cache_key] = {'data': admins, 'timestamp': datetime.now().timestamp()}
+        CACHE[cache_key] = {'data': admins, 'timestamp': time.monotonic()}
         return admins
     except Exception as e:
         logger.error(f"Error loading admin users: {e}")
@@ -228,8 +302,18 @@ def cors_headers() -> Dict[str, str]:
 
 
 def json_response(data: Any, status: int = 200):
-    """Create JSON response with CORS headers."""
-    return (json.dumps(data, ensure_ascii=False), status, cors_headers())
+    """
+    Create JSON response with CORS headers.
+
+    /articles responses carry full article bodies for every requested date,
+    so orjson is used when installed; like ensure_ascii=False it emits UTF-8
+    as-is. OPT_NON_STR_KEYS keeps dicts with non-string keys serializable.
+    """
+    if ORJSON_AVAILABLE:
+        body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(data, ensure_ascii=False)
+    return (body, status, cors_headers())
 
 
 def error_response(message: str, status: int = 400):
@@ -246,29 +330,92 @@ def get_cache_key(date: str) -> str:
     return f"articles_{date}"
 
 
-def get_cached_articles(date: str) -> Optional[List[Dict[str, Any]]]:
-    """Get cached articles if still valid."""
+def get_cached_articles(date: str, now: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Get cached articles if still valid.
+
+    Args:
+        date: Date string (YYYY-MM-DD)
+        now: time.monotonic() reading to compare against; callers checking
+             many dates read the clock once and pass it in
+    """
     cache_key = get_cache_key(date)
     entry = CACHE.get(cache_key)
 
     if not entry:
         return None
 
-    if datetime.now().timestamp() - entry['timestamp'] >= CACHE_TTL_SECONDS:
-        del CACHE[cache_key]
+    if now is None:
+        now = time.monotonic()
+    if now - entry['timestamp'] >= entry.get('ttl', CACHE_TTL_SECONDS):
+        # pop: a concurrent request may have evicted the same entry already
+        CACHE.pop(cache_key, None)
         return None
 
+    # Re-insert so dict order tracks read recency as well as writes
+    CACHE.pop(cache_key, None)
+    CACHE[cache_key] = entry
     return entry['articles']
 
 
-def set_cached_articles(date: str, articles: List[Dict[str, Any]]) -> None:
-    """Cache articles with timestamp."""
+def get_article_cache_ttl(date: str, today: str) -> int:
+    """
+    Get the cache TTL for a date's articles.
+
+    Args:
+        date: Date string (YYYY-MM-DD)
+        today: Today's date string (YYYY-MM-DD)
+
+    Returns:
+        CACHE_TTL_SECONDS for today (new runs keep landing), otherwise
+        PAST_DATE_CACHE_TTL_SECONDS
+    """
+    return PAST_DATE_CACHE_TTL_SECONDS if date < today else CACHE_TTL_SECONDS
+
+
+def set_cached_articles(
+    date: str,
+    articles: List[Dict[str, Any]],
+    ttl_seconds: Optional[int] = None,
+    protected_keys: Collection[str] = ()
+) -> None:
+    """
+    Cache articles with timestamp and TTL (defaults to CACHE_TTL_SECONDS).
+
+    Expired dates are dropped, then the least recently used dates are evicted
+    beyond ARTICLE_CACHE_MAX_DATES to keep memory bounded.
+
+    Args:
+        date: Date string (YYYY-MM-DD)
+        articles: Articles for the date
+        ttl_seconds: Entry TTL
+        protected_keys: Cache keys never evicted by this call; a request
+            spanning more dates than the limit passes its own keys so it
+            does not evict dates it has just cached
+    """
     cache_key = get_cache_key(date)
+    now = time.monotonic()
+    CACHE.pop(cache_key, None)  # Re-insert so dict order tracks recency
     CACHE[cache_key] = {
         'articles': articles,
-        'timestamp': datetime.now().timestamp()
+        'timestamp': now,
+        'ttl': ttl_seconds if ttl_seconds is not None else CACHE_TTL_SECONDS
     }
 
+    evictable = []
+    for key in list(CACHE):
+        if not key.startswith('articles_') or key == cache_key or key in protected_keys:
+            continue
+        entry = CACHE.get(key)
+        if entry and now - entry['timestamp'] >= entry.get('ttl', CACHE_TTL_SECONDS):
+            CACHE.pop(key, None)
+        else:
+            evictable.append(key)
+
+    article_count = sum(1 for key in list(CACHE) if key.startswith('articles_'))
+    for key in evictable[:max(article_count - ARTICLE_CACHE_MAX_DATES, 0)]:
+        CACHE.pop(key, None)
+
 
 def get_date_range(start_date: str, end_date: str) -> List[str]:
     """Generate list of dates between start and end (inclusive)."""
@@ -283,36 +430,140 @@ def get_date_range(start_date: str, end_date: str) -> List[str]:
     return dates
 
 
+def intern_str(value: Any) -> Any:
+    """Intern a string value so repeats share one object; non-strings pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
 def normalize_article(article: Dict[str, Any], content_map: Dict[str, str] = None) -> Dict[str, Any]:
     """Normalize article to consistent schema."""
-    article_id = article.get('article_id')
+    # Bound once: this runs per article on every uncached /articles fetch
+    get = article.get
+    article_id = get('article_id')
     
-    content = article.get('body') or article.get('content') or ''
+    content = get('body') or get('content') or ''
     if content_map and article_id and article_id in content_map:
         content = content_map[article_id]
     
+    # Low-cardinality fields are interned: normalized articles sit in CACHE
+    # for up to an hour and repeat the same few sources/languages/regions
     return {
         'article_id': article_id,
-        'original_url': article.get('original_url'),
-        'merged_from_urls': article.get('merged_from_urls'),
-        'title': article.get('title'),
-        'summary': article.get('summary'),
+        'original_url': get('original_url'),
+        'merged_from_urls': get('merged_from_urls'),
+        'title': get('title'),
+        'summary': get('summary'),
         'content': content,
-        'source': article.get('source'),
-        'publish_date': article.get('publish_date'),
-        'categories': article.get('categories', []),
-        'key_entities': article.get('key_entities', {}),
-        'content_quality': article.get('content_quality', 'medium'),
-        'confidence': article.get('confidence', 0.8),
-        'language': article.get('language'),
-        'region': article.get('region'),
-        'summary_translation': article.get('summary_translation'),
-        'x_post': article.get('x_post'),
-        'source_type': article.get('source_type', 'scraped'),
-        'keywords_used': article.get('keywords_used', [])  # For UI keyword highlighting
+        'source': intern_str(get('source')),
+        'publish_date': get('publish_date'),
+        'categories': get('categories', []),
+        'key_entities': get('key_entities', {}),
+        'content_quality': intern_str(get('content_quality', 'medium')),
+        'confidence': get('confidence', 0.8),
+        'language': intern_str(get('language')),
+        'region': intern_str(get('region')),
+        'summary_translation': get('summary_translation'),
+        'x_post': get('x_post'),
+        'source_type': intern_str(get('source_type', 'scraped')),
+        'keywords_used': get('keywords_used', [])  # For UI keyword highlighting
     }
 
 
+def load_blob_json(blob, project: Optional[Callable[[Any], Any]] = None) -> Any:
+    """
+    Download and parse a JSON blob, reusing the parsed result for unchanged objects.
+
+    Args:
+        blob: GCS blob (from list_blobs, so name and generation are populated)
+        project: Optional function reducing the parsed data to the fields a
+            caller needs; only its result is returned and cached
+
+    Returns:
+        Parsed (or projected) JSON data
+    """
+    generation = getattr(blob, 'generation', None)
+    cache_key = None
+    if generation is not None:
+        cache_key = (blob.name, generation) if project is None else (blob.name, generation, project.__name__)
+
+    if cache_key is not None:
+        with BLOB_JSON_CACHE_LOCK:
+            cached = BLOB_JSON_CACHE.get(cache_key)
+            if cached is not None:
+                BLOB_JSON_CACHE.move_to_end(cache_key)
+                return cached[0]
+
+    data = parse_json_bytes(blob.download_as_bytes())
+    if project is not None:
+        data = project(data)
+
+    # Blobs of unknown size, or too large to share the budget, are not cached
+    size = getattr(blob, 'size', None)
+    if cache_key is not None and isinstance(size, int) and size <= BLOB_JSON_CACHE_MAX_BYTES:
+        with BLOB_JSON_CACHE_LOCK:
+            BLOB_JSON_CACHE[cache_key] = (data, size)
+            total_bytes = sum(entry_size for _, entry_size in BLOB_JSON_CACHE.values())
+            while (len(BLOB_JSON_CACHE) > BLOB_JSON_CACHE_MAX_ENTRIES
+                   or total_bytes > BLOB_JSON_CACHE_MAX_BYTES):
+                _, (_, evicted_size) = BLOB_JSON_CACHE.popitem(last=False)
+                total_bytes -= evicted_size
+
+    return data
+
+
+def load_blobs_json(
+    blobs: List[Any],
+    log_prefix: str = "",
+    project: Optional[Callable[[Any], Any]] = None
+) -> List[Tuple[Any, Any]]:
+    """
+    Download and parse several JSON blobs concurrently.
+
+    Args:
+        blobs: GCS blobs to load
+        log_prefix: Optional prefix for error log lines (e.g. "[DIFF] ")
+        project: Optional projection passed through to load_blob_json
+
+    Returns:
+        List of (blob, data) tuples in input order; blobs that fail to
+        download or parse are logged and omitted
+    """
+    if not blobs:
+        return []
+
+    def _load(blob):
+        try:
+            return blob, load_blob_json(blob, project)
+        except Exception as e:
+            logger.error(f"{log_prefix}Error processing {blob.name}: {e}")
+            return blob, None
+
+    return [(blob, data) for blob, data in BLOB_DOWNLOAD_EXECUTOR.map(_load, blobs) if data is not None]
+
+
+def project_article_bodies(data: Any) -> List[Tuple[str, str]]:
+    """
+    Reduce a batch input file to (article_id, body) pairs.
+
+    Batch inputs carry full article payloads, but the content map only needs
+    the body text; projecting right after parsing lets the rest of the parsed
+    file be freed instead of being held in BLOB_JSON_CACHE.
+
+    Args:
+        data: Parsed batch input JSON ({"articles": [...]})
+
+    Returns:
+        List of (article_id, body) tuples for articles that have both
+    """
+    pairs = []
+    for article in data.get('articles', []):
+        article_id = article.get('article_id')
+        body = article.get('body') or article.get('content') or ''
+        if article_id and body:
+            pairs.append((article_id, body))
+    return pairs
+
+
 def load_content_map(date: str) -> Dict[str, str]:
     """Load article content from batch input files."""
     content_map = {}
@@ -320,7 +571,10 @@ def load_content_map(date: str) -> Dict[str, str]:
     try:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         date_prefix = f"ingestion/{date}/"
-        all_blobs = list(bucket.list_blobs(prefix=date_prefix))
+        all_blobs = list(bucket.list_blobs(
+            prefix=date_prefix,
+            match_glob=f"{date_prefix}**/batch_enrichment/**/input/*.json"
+        ))
         
         input_files = [
             b for b in all_blobs
@@ -329,19 +583,8 @@ def load_content_map(date: str) -> Dict[str, str]:
             and b.name.endswith('.json')
         ]
         
-        for blob in input_files:
-            try:
-                data = json.loads(blob.download_as_text())
-                articles = data.get('articles', [])
-                
-                for article in articles:
-                    article_id = article.get('article_id')
-                    body = article.get('body') or article.get('content') or ''
-                    if article_id and body:
-                        content_map[article_id] = body
-                        
-            except Exception as e:
-                logger.error(f"Error loading content from {blob.name}: {e}")
+        for blob, pairs in load_blobs_json(input_files, project=project_article_bodies):
+            content_map.update(pairs)
                 
     except Exception as e:
         logger.error(f"Error loading content map for {date}: {e}")
@@ -356,7 +599,10 @@ def fetch_articles_for_date(date: str) -> List[Dict[str, Any]]:
 
     try:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
-        blobs = list(bucket.list_blobs(prefix=prefix))
+        blobs = list(bucket.list_blobs(
+            prefix=prefix,
+            match_glob=f"{prefix}**/enriched_*_articles.json"
+        ))
         content_map = load_content_map(date)
 
         enriched_files = [
@@ -364,11 +610,8 @@ def fetch_articles_for_date(date: str) -> List[Dict[str, Any]]:
             if 'enriched_' in b.name and b.name.endswith('_articles.json')
         ]
 
-        for blob in enriched_files:
+        for blob, data in load_blobs_json(enriched_files):
             try:
-                content = blob.download_as_text()
-                data = json.loads(content)
-
                 article_list = []
                 if isinstance(data, list):
                     article_list = data
@@ -436,13 +679,16 @@ def handle_get_articles(request: Request):
         dates_to_fetch = [datetime.now().strftime('%Y-%m-%d')]
 
     all_articles = []
+    now = time.monotonic()
+    today = datetime.now().strftime('%Y-%m-%d')
+    request_keys = {get_cache_key(date) for date in dates_to_fetch}
     for date in dates_to_fetch:
-        cached = get_cached_articles(date)
-        if cached is not None and not no_cache:
+        cached = None if no_cache else get_cached_articles(date, now)
+        if cached is not None:
             all_articles.extend(cached)
         else:
             date_articles = fetch_articles_for_date(date)
-            set_cached_articles(date, date_articles)
+            set_cached_articles(date, date_articles, get_article_cache_ttl(date, today), request_keys)
             all_articles.extend(date_articles)
 
     unique_articles = deduplicate_articles(all_articles)
@@ -461,6 +707,23 @@ def handle_get_articles(request: Request):
     return json_response(unique_articles)
 
 
+def get_diff_response_key(diff_files: List[Any]) -> Optional[tuple]:
+    """
+    Build the DIFF_RESPONSE_CACHE key for a set of listed diff files.
+
+    Args:
+        diff_files: Blobs from list_blobs (name and generation populated)
+
+    Returns:
+        Tuple of (name, generation) pairs, or None if any generation is
+        unknown (such a response must not be cached)
+    """
+    key = tuple((blob.name, getattr(blob, 'generation', None)) for blob in diff_files)
+    if any(generation is None for _, generation in key):
+        return None
+    return key
+
+
 def handle_get_diff(request: Request):
     """GET /articles?region=diff - Fetch region diff analysis files."""
     # Validate API key
@@ -502,39 +765,60 @@ def handle_get_diff(request: Request):
     try:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
 
+        diff_files = []
         for date in dates_to_fetch:
             diff_prefix = f"ingestion/{date}/"
             logger.info(f"[DIFF] Searching for diff files: {diff_prefix}")
 
-            blobs = list(bucket.list_blobs(prefix=diff_prefix))
+            blobs = list(bucket.list_blobs(
+                prefix=diff_prefix,
+                match_glob=f"{diff_prefix}**/analysis/region_diff_*.json"
+            ))
 
             # Find region_diff files in analysis folders
-            diff_files = [
+            date_files = [
                 b for b in blobs
                 if '/analysis/region_diff_' in b.name and b.name.endswith('.json')
             ]
+            diff_files.extend(date_files)
+
+            logger.info(f"[DIFF] Found {len(date_files)} diff files for {date}")
+
+        # The response is fully determined by the diff files' contents, so an
+        # unchanged set of (name, generation) pairs can reuse the last result
+        response_key = get_diff_response_key(diff_files)
+        if response_key is not None:
+            with DIFF_RESPONSE_CACHE_LOCK:
+                cached = DIFF_RESPONSE_CACHE.get(response_key)
+                if cached is not None:
+                    DIFF_RESPONSE_CACHE.move_to_end(response_key)
+            if cached is not None:
+                logger.info(f"[DIFF] Serving {len(cached)} cached entries")
+                return json_response(cached)
+
+        loaded = load_blobs_json(diff_files, log_prefix="[DIFF] ")
+        # Failed downloads are dropped by load_blobs_json; a partial result must
+        # not be cached under the full key or it outlives the transient error
+        complete = len(loaded) == len(diff_files)
+
+        for blob, diff_data in loaded:
+            try:
 
-            logger.info(f"[DIFF] Found {len(diff_files)} diff files for {date}")
-
-            for blob in diff_files:
-                try:
-                    content = blob.download_as_text()
-                    diff_data = json.loads(content)
-
-                    # Aggregate summaries
-                    if diff_data.get('summary'):
-                        all_diff_results['summary']['total_region1_articles'] += diff_data['summary'].get('total_region1_articles', 0)
-                        all_diff_results['summary']['total_region2_articles'] += diff_data['summary'].get('total_region2_articles', 0)
-                        all_diff_results['summary']['unique_to_region1'] += diff_data['summary'].get('unique_to_region1', 0)
+                # Aggregate summaries
+                if diff_data.get('summary'):
+                    all_diff_results['summary']['total_region1_articles'] += diff_data['summary'].get('total_region1_articles', 0)
+                    all_diff_results['summary']['total_region2_articles'] += diff_data['summary'].get('total_region2_articles', 0)
+                    all_diff_results['summary']['unique_to_region1'] += diff_data['summary'].get('unique_to_region1', 0)
 
-                    # Collect unique articles
-                    if diff_data.get('unique_articles'):
-                        all_diff_results['unique_articles'].extend(diff_data['unique_articles'])
+                # Collect unique articles
+                if diff_data.get('unique_articles'):
+                    all_diff_results['unique_articles'].extend(diff_data['unique_articles'])
 
-                    logger.info(f"[DIFF] Loaded {len(diff_data.get('unique_articles', []))} articles from {blob.name}")
+                logger.info("[DIFF] Loaded %d articles from %s", len(diff_data.get('unique_articles', [])), blob.name)
 
-                except Exception as e:
-                    logger.error(f"[DIFF] Error processing {blob.name}: {e}")
+            except Exception as e:
+                complete = False
+                logger.error(f"[DIFF] Error processing {blob.name}: {e}")
 
         # Deduplicate by article_id
         seen_ids = set()
@@ -566,6 +850,12 @@ def handle_get_diff(request: Request):
             }
             news_entries.append(entry)
 
+        if response_key is not None and complete:
+            with DIFF_RESPONSE_CACHE_LOCK:
+                DIFF_RESPONSE_CACHE[response_key] = news_entries
+                if len(DIFF_RESPONSE_CACHE) > DIFF_RESPONSE_CACHE_MAX_ENTRIES:
+                    DIFF_RESPONSE_CACHE.popitem(last=False)
+
         return json_response(news_entries)
 
     except Exception as e:
@@ -592,13 +882,12 @@ def handle_get_preferences(request: Request):
     if not user:
         return error_response('Invalid or missing token', 401)
     
-    email_hash = hash_email(user['email'])
-    
     try:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
-        blob = bucket.blob(f'{USER_PREFERENCES_FOLDER}{email_hash}/preferences.json')
+        blob = bucket.blob(get_user_preferences_path(user['email']))
         
-        if not blob.exists():
+        content = download_json_if_exists(blob)
+        if content is None:
             return json_response({
                 'email': user['email'],
                 'scraperConfig': None,
@@ -607,7 +896,6 @@ def handle_get_preferences(request: Request):
                 'lastUpdated': None
             })
         
-        content = json.loads(blob.download_as_text())
         return json_response(content)
     except Exception as e:
         logger.error(f"Error loading preferences: {e}")
@@ -620,18 +908,14 @@ def handle_put_preferences(request: Request):
     if not user:
         return error_response('Invalid or missing token', 401)
     
-    email_hash = hash_email(user['email'])
-    
     try:
         data = request.get_json() or {}
         
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
-        blob = bucket.blob(f'{USER_PREFERENCES_FOLDER}{email_hash}/preferences.json')
+        blob = bucket.blob(get_user_preferences_path(user['email']))
         
         # Load existing if available
-        existing = {'version': 0}
-        if blob.exists():
-            existing = json.loads(blob.download_as_text())
+        existing = download_json_if_exists(blob) or {'version': 0}
         
         preferences = {
             'email': user['email'],
@@ -663,15 +947,15 @@ def handle_get_news_api_config(request: Request):
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(f'{CONFIG_FOLDER}news_api_config.json')
         
-        if not blob.exists():
+        content = download_json_if_exists(blob)
+        if content is None:
             return json_response({
-                'default_keywords': ['fenerbahce', 'galatasaray', 'tedesco'],
+                'default_keywords': list(DEFAULT_NEWS_API_KEYWORDS),
                 'default_time_range': 'last_24_hours',
                 'default_max_results': 100,
                 'available_time_ranges': ['last_24_hours', 'last_7_days', 'last_30_days']
             })
         
-        content = json.loads(blob.download_as_text())
         return json_response(content)
     except Exception as e:
         logger.error(f"Error loading news API config: {e}")
@@ -758,7 +1042,7 @@ def handle_trigger_news_api(request: Request):
         data = request.get_json() or {}
         
         payload = {
-            'keywords': data.get('keywords', ['fenerbahce', 'galatasaray', 'tedesco']),
+            'keywords': data.get('keywords', DEFAULT_NEWS_API_KEYWORDS),
             'time_range': data.get('time_range', 'last_24_hours'),
             'max_results': data.get('max_results', 50),
             'triggered_by': user['email']
@@ -786,6 +1070,21 @@ def handle_trigger_news_api(request: Request):
 # MAIN ENTRY POINT
 # =============================================================================
 
+# (path, method) -> handler; paths are matched after stripping the trailing '/'
+ROUTES = {
+    ('', 'GET'): handle_get_articles,
+    ('/articles', 'GET'): handle_get_articles,
+    ('/user', 'GET'): handle_get_user,
+    ('/user/preferences', 'GET'): handle_get_preferences,
+    ('/user/preferences', 'PUT'): handle_put_preferences,
+    ('/config/news-api', 'GET'): handle_get_news_api_config,
+    ('/config/allowed-users', 'GET'): handle_get_allowed_users,
+    ('/config/admin-users', 'GET'): handle_get_admin_status,
+    ('/trigger/scraper', 'POST'): handle_trigger_scraper,
+    ('/trigger/news-api', 'POST'): handle_trigger_news_api,
+}
+
+
 @functions_framework.http
 def main(request: Request):
     """HTTP Cloud Function entry point - routes requests to handlers."""
@@ -798,42 +1097,12 @@ def main(request: Request):
     path = request.path.rstrip('/')
     method = request.method
 
-    logger.info(f"{method} {path}")
+    logger.info("%s %s", method, path)
 
-    # Route to appropriate handler
-    if path == '/articles' or path == '' or path == '/':
-        if method == 'GET':
-            return handle_get_articles(request)
-    
-    elif path == '/user':
-        if method == 'GET':
-            return handle_get_user(request)
-    
-    elif path == '/user/preferences':
-        if method == 'GET':
-            return handle_get_preferences(request)
-        elif method == 'PUT':
-            return handle_put_preferences(request)
-    
-    elif path == '/config/news-api':
-        if method == 'GET':
-            return handle_get_news_api_config(request)
-
-    elif path == '/config/allowed-users':
-        if method == 'GET':
-            return handle_get_allowed_users(request)
-
-    elif path == '/config/admin-users':
-        if method == 'GET':
-            return handle_get_admin_status(request)
-
-    elif path == '/trigger/scraper':
-        if method == 'POST':
-            return handle_trigger_scraper(request)
-    
-    elif path == '/trigger/news-api':
-        if method == 'POST':
-            return handle_trigger_news_api(request)
+    # Route to appropriate handler with one dict lookup
+    handler = ROUTES.get((path, method))
+    if handler is not None:
+        return handler(request)
 
     return error_response(f'Not found: {method} {path}', 404)
 
@@ -13,16 +13,24 @@ source_type directory, not just the triggered file. This prevents data loss when
 multiple batch jobs (e.g., singletons + decisions) create separate prediction folders.
 """
 
+import io
 import os
 import json
 import logging
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 from google.cloud import storage
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 # CET timezone for timestamps
 CET = ZoneInfo("Europe/Berlin")
@@ -51,6 +59,9 @@ else:
 PROJECT_ID = os.getenv('GOOGLE_CLOUD_PROJECT', 'gen-lang-client-0306766464')
 GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', 'aisports-scraping')
 
+# Concurrent downloads for batch input files (network-bound GCS reads)
+BLOB_DOWNLOAD_WORKERS = 8
+
 # Language normalization map
 LANGUAGE_MAP = {
     'turkish': 'tr',
@@ -107,12 +118,17 @@ def download_jsonl(gcs_path: str) -> List[Dict[str, Any]]:
     try:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(gcs_path)
-        content = blob.download_as_text()
+        # Parse straight from bytes: skips decoding the (often multi-MB)
+        # predictions file into one big str before splitting it. Iterating a
+        # BytesIO yields one line at a time instead of a second full copy
+        # of the file as a list of lines
+        content = blob.download_as_bytes()
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
         results = []
-        for line in content.strip().split('\n'):
+        for line in io.BytesIO(content):
             if line.strip():
-                results.append(json.loads(line))
+                results.append(loads(line))
 
         logger.info(f"Downloaded {len(results)} entries from {gcs_path}")
         return results
@@ -147,7 +163,7 @@ def find_all_prediction_folders(run_folder: str, job_type: str, source_type: str
         for blob in blobs:
             if blob.name.endswith('predictions.jsonl'):
                 prediction_files.append(blob.name)
-                logger.info(f"Found prediction file: {blob.name}")
+                logger.info("Found prediction file: %s", blob.name)
 
         logger.info(f"Found {len(prediction_files)} prediction files under {prefix}")
         return prediction_files
@@ -278,6 +294,8 @@ def transform_enrichment_results(entries: List[Dict[str, Any]],
     """
     enriched_articles = []
     original_articles = original_articles or {}
+    # One timestamp per batch - every article in the job is enriched "now"
+    enriched_at = datetime.now(timezone.utc).isoformat()
 
     for entry in entries:
         content = extract_response_content(entry)
@@ -303,20 +321,22 @@ def transform_enrichment_results(entries: List[Dict[str, Any]],
 
             # Deep merge key_entities to ensure all required fields exist
             raw_entities = article.get('key_entities', {})
+            if not isinstance(raw_entities, dict):
+                raw_entities = {}
             key_entities = {
-                'teams': raw_entities.get('teams', []) if isinstance(raw_entities, dict) else [],
-                'players': raw_entities.get('players', []) if isinstance(raw_entities, dict) else [],
-                'amounts': raw_entities.get('amounts', []) if isinstance(raw_entities, dict) else [],
-                'dates': raw_entities.get('dates', []) if isinstance(raw_entities, dict) else [],
-                'competitions': raw_entities.get('competitions', []) if isinstance(raw_entities, dict) else [],
-                'locations': raw_entities.get('locations', []) if isinstance(raw_entities, dict) else []
+                'teams': raw_entities.get('teams', []),
+                'players': raw_entities.get('players', []),
+                'amounts': raw_entities.get('amounts', []),
+                'dates': raw_entities.get('dates', []),
+                'competitions': raw_entities.get('competitions', []),
+                'locations': raw_entities.get('locations', [])
             }
 
             # Preserve original metadata and merge with enrichment info
             original_metadata = article.get('_processing_metadata', original.get('_processing_metadata', {}))
             processing_metadata = {
                 **original_metadata,  # Preserve original Stage 1 metadata
-                'enriched_at': datetime.now(timezone.utc).isoformat(),
+                'enriched_at': enriched_at,
                 'enrichment_processor': 'batch_enrichment'
             }
 
@@ -397,6 +417,7 @@ def transform_merge_results(entries: List[Dict[str, Any]], groups_data: Dict[str
     # If we have original groups data, apply decisions to produce articles
     # Otherwise, just return the decisions (transformer will need to handle separately)
     decided_articles = []
+    decided_at = datetime.now(timezone.utc).isoformat()
     for decision in all_decisions:
         decided_articles.append({
             'group_id': decision.get('group_id'),
@@ -410,7 +431,7 @@ def transform_merge_results(entries: List[Dict[str, Any]], groups_data: Dict[str
             'kept_separate_ids': decision.get('kept_separate_ids', []),
             'kept_separate_urls': decision.get('kept_separate_urls', []),
             '_merge_metadata': {
-                'decided_at': datetime.now(timezone.utc).isoformat(),
+                'decided_at': decided_at,
                 'processor': 'batch_merge'
             }
         })
@@ -419,6 +440,17 @@ def transform_merge_results(entries: List[Dict[str, Any]], groups_data: Dict[str
     return decided_articles
 
 
+def download_json_if_exists(blob) -> Optional[Any]:
+    """Download and parse a JSON blob, returning None if it does not exist (404)."""
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    try:
+        return loads(blob.download_as_bytes())
+    except Exception as e:
+        if getattr(e, 'code', None) == 404:
+            return None
+        raise
+
+
 def load_singletons(run_folder: str, source_type: str) -> List[Dict[str, Any]]:
     """Load singleton articles saved by merge_decider."""
     try:
@@ -426,12 +458,11 @@ def load_singletons(run_folder: str, source_type: str) -> List[Dict[str, Any]]:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(singleton_path)
 
-        if not blob.exists():
+        data = download_json_if_exists(blob)
+        if data is None:
             logger.info("No singletons file found")
             return []
 
-        content = blob.download_as_text()
-        data = json.loads(content)
         singletons = data.get('articles', [])
         logger.info(f"Loaded {len(singletons)} singleton articles")
         return singletons
@@ -458,6 +489,7 @@ def load_original_articles(run_folder: str, source_type: str) -> Dict[str, Dict[
     """
     article_map = {}
     bucket = storage_client.bucket(GCS_BUCKET_NAME)
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
     # Folder patterns for batch input files
     input_folders = [
@@ -474,11 +506,22 @@ def load_original_articles(run_folder: str, source_type: str) -> Dict[str, Dict[
                 logger.info(f"No batch input files found in: {folder_prefix}")
                 continue
 
-            for blob in json_blobs:
+            def _load(blob):
                 try:
-                    content = blob.download_as_text()
-                    data = json.loads(content)
+                    return blob, loads(blob.download_as_bytes())
+                except Exception as e:
+                    logger.warning(f"Could not load {blob.name}: {e}")
+                    return blob, None
 
+            # Download concurrently; map() keeps file order so later files
+            # still win for duplicate article_ids
+            with ThreadPoolExecutor(max_workers=min(BLOB_DOWNLOAD_WORKERS, len(json_blobs))) as executor:
+                loaded = list(executor.map(_load, json_blobs))
+
+            for blob, data in loaded:
+                if data is None:
+                    continue
+                try:
                     # Batch input files have 'articles' array
                     articles = data.get('articles', [])
 
@@ -488,7 +531,7 @@ def load_original_articles(run_folder: str, source_type: str) -> Dict[str, Dict[
                         if aid and article.get('body'):  # Only include if has body
                             article_map[aid] = article
 
-                    logger.info(f"Loaded {len(articles)} articles from {blob.name}")
+                    logger.info("Loaded %d articles from %s", len(articles), blob.name)
 
                 except Exception as e:
                     logger.warning(f"Could not load {blob.name}: {e}")
@@ -508,12 +551,12 @@ def load_groups_data(run_folder: str, source_type: str) -> Dict[str, Any]:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(groups_path)
 
-        if not blob.exists():
+        data = download_json_if_exists(blob)
+        if data is None:
             logger.info("No groups file found")
             return {}
 
-        content = blob.download_as_text()
-        return json.loads(content)
+        return data
 
     except Exception as e:
         logger.warning(f"Could not load groups data: {e}")
@@ -659,13 +702,14 @@ def apply_merge_decisions(decisions: List[Dict], groups_data: Dict) -> List[Dict
     return output_articles
 
 
-def upload_json(data: Any, gcs_path: str) -> str:
+def upload_json(data: Any, gcs_path: str, pretty: bool = False) -> str:
     """
     Upload JSON data to GCS.
 
     Args:
         data: Data to serialize
         gcs_path: GCS blob path
+        pretty: Indent output (default compact, since article files are machine-read)
 
     Returns:
         GCS URI of uploaded file
@@ -674,7 +718,7 @@ def upload_json(data: Any, gcs_path: str) -> str:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(gcs_path)
         blob.upload_from_string(
-            json.dumps(data, ensure_ascii=False, indent=2),
+            json.dumps(data, ensure_ascii=False, indent=2 if pretty else None),
             content_type='application/json'
         )
 
@@ -67,6 +67,8 @@ GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', 'aisports-scraping')
 VERTEX_AI_LOCATION = os.getenv('VERTEX_AI_LOCATION', 'us-central1')
 VERTEX_AI_MODEL = os.getenv('VERTEX_AI_MODEL', 'gemini-2.0-flash')
 
+JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 # File patterns that trigger this function
 TRIGGER_PATTERNS = [
     'grouped_complete_articles.json',
@@ -332,7 +334,7 @@ class MergeDecider:
             GCS URI of uploaded file
         """
         # Create JSONL content
-        jsonl_content = '\n'.join(json.dumps(r, ensure_ascii=False) for r in requests)
+        jsonl_content = '\n'.join(JSONL_ENCODER.encode(r) for r in requests)
 
         # Upload path
         blob_path = f"{run_folder}/batch_merge/{source_type}/request.jsonl"
@@ -460,7 +462,7 @@ class MergeDecider:
             bucket = self.storage_client.bucket(GCS_BUCKET_NAME)
             blob = bucket.blob(output_path)
             blob.upload_from_string(
-                json.dumps({'articles': output_articles}, ensure_ascii=False, indent=2),
+                json.dumps({'articles': output_articles}, ensure_ascii=False),
                 content_type='application/json'
             )
             logger.info(f"All singletons - saved directly to {output_path}")
@@ -492,7 +494,7 @@ class MergeDecider:
             bucket = self.storage_client.bucket(GCS_BUCKET_NAME)
             blob = bucket.blob(singleton_path)
             blob.upload_from_string(
-                json.dumps({'articles': singleton_articles}, ensure_ascii=False, indent=2),
+                json.dumps({'articles': singleton_articles}, ensure_ascii=False),
                 content_type='application/json'
             )
             logger.info(f"Saved {len(singleton_articles)} singleton articles")
@@ -525,6 +527,21 @@ class MergeDecider:
         }
 
 
+# Shared instance for warm invocations, created on first trigger
+_decider = None
+
+
+def get_decider() -> MergeDecider:
+    """Return the shared MergeDecider, creating it on first use."""
+    global _decider
+    if _decider is None:
+        decider = MergeDecider()
+        if decider.genai_client is None and ENVIRONMENT != 'local':
+            return decider
+        _decider = decider
+    return _decider
+
+
 def process_groups(event, context):
     """
     Cloud Function entry point.
@@ -547,7 +564,7 @@ def process_groups(event, context):
         return
 
     try:
-        decider = MergeDecider()
+        decider = get_decider()
 
         if not decider.genai_client and ENVIRONMENT != 'local':
             logger.error("Vertex AI client not available")
@@ -573,7 +590,7 @@ def main(request):
         if not gcs_path:
             return {"error": "gcs_path required"}, 400
 
-        decider = MergeDecider()
+        decider = get_decider()
         result = decider.process(gcs_path)
 
         return result, 200
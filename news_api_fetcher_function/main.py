@@ -10,15 +10,23 @@ import sys
 import json
 import base64
 import asyncio
+import hashlib
 import logging
+from collections import defaultdict
 from datetime import datetime, timezone
+from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 # CET timezone for run timestamps
 CET = ZoneInfo("Europe/Berlin")
-from pathlib import Path
 
 from google.cloud import pubsub_v1, storage, secretmanager
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
 
 # Import the news aggregator
 from news_aggregator import NewsAggregator, is_content_complete
@@ -87,7 +95,6 @@ def get_api_keys() -> dict:
 
 def generate_article_id(url: str) -> str:
     """Generate a unique article ID from URL using MD5 hash (first 16 chars)."""
-    import hashlib
     return hashlib.md5(url.encode()).hexdigest()[:16]
 
 
@@ -101,7 +108,6 @@ def transform_api_article_to_session_schema(article: dict) -> dict:
     url = article.get('original_url') or article.get('url', '')
 
     # Extract domain from URL
-    from urllib.parse import urlparse
     parsed = urlparse(url)
     domain = parsed.netloc
 
@@ -114,10 +120,13 @@ def transform_api_article_to_session_schema(article: dict) -> dict:
     # Map to region: tr -> tr, everything else -> eu
     region = 'tr' if language == 'tr' else 'eu'
 
+    # Only format a fallback timestamp when fetched_at is actually missing
+    scraped_at = article['fetched_at'] if 'fetched_at' in article else datetime.now(timezone.utc).isoformat()
+
     # Transform to session schema
     transformed = {
         "url": url,
-        "scraped_at": article.get('fetched_at', datetime.now(timezone.utc).isoformat()),
+        "scraped_at": scraped_at,
         "keywords_used": article.get('keywords_matched', []),
         "title": article.get('title', ''),
         "body": article.get('content', ''),  # Rename content -> body
@@ -134,8 +143,13 @@ def transform_api_article_to_session_schema(article: dict) -> dict:
     return transformed
 
 
-def upload_to_gcs(bucket_name: str, blob_path: str, data: dict) -> str:
-    """Upload JSON data to GCS and return the blob path."""
+def upload_to_gcs(bucket_name: str, blob_path: str, data: dict, pretty: bool = False) -> str:
+    """
+    Upload JSON data to GCS and return the blob path.
+
+    Article payloads are written compact (they are only consumed by code);
+    pass pretty=True for small human-inspected files such as metadata.
+    """
     if not storage_client:
         logger.warning("Storage client not available, skipping upload")
         return blob_path
@@ -144,7 +158,7 @@ def upload_to_gcs(bucket_name: str, blob_path: str, data: dict) -> str:
         bucket = storage_client.bucket(bucket_name)
         blob = bucket.blob(blob_path)
         blob.upload_from_string(
-            json.dumps(data, ensure_ascii=False, indent=2),
+            json.dumps(data, ensure_ascii=False, indent=2 if pretty else None),
             content_type='application/json'
         )
         logger.info(f"Uploaded data to gs://{bucket_name}/{blob_path}")
@@ -154,6 +168,61 @@ def upload_to_gcs(bucket_name: str, blob_path: str, data: dict) -> str:
         raise
 
 
+def iter_article_urls(blob):
+    """
+    Yield article URLs from an articles JSON blob.
+
+    With ijson available the blob is streamed and only the URL fields are
+    materialized; article bodies are never built into Python objects.
+    Falls back to a full json.loads otherwise.
+
+    Args:
+        blob: GCS blob containing {"articles": [...]}
+
+    Yields:
+        original_url (or url) of each article that has one
+    """
+    if IJSON_AVAILABLE:
+        with blob.open('rb') as f:
+            url = original_url = None
+            for prefix, event, value in ijson.parse(f):
+                if prefix == 'articles.item.original_url' and event == 'string':
+                    original_url = value
+                elif prefix == 'articles.item.url' and event == 'string':
+                    url = value
+                elif prefix == 'articles.item' and event == 'end_map':
+                    if original_url or url:
+                        yield original_url or url
+                    url = original_url = None
+        return
+
+    data = json.loads(blob.download_as_string())
+    for article in data.get('articles', []):
+        url = article.get('original_url') or article.get('url')
+        if url:
+            yield url
+
+
+async def upload_raw_responses(bucket_name: str, base_path: str, raw_responses: dict) -> None:
+    """
+    Upload raw API responses to {base_path}/responses/{api_name}.json.
+
+    The blobs are independent, so they are written concurrently from worker
+    threads instead of one blocking upload after another on the event loop.
+
+    Args:
+        bucket_name: GCS bucket name
+        base_path: Run folder path
+        raw_responses: Dict mapping API name to its raw response data
+    """
+    async def _upload(api_name: str, response_data: dict) -> None:
+        response_path = f"{base_path}/responses/{api_name}.json"
+        await asyncio.to_thread(upload_to_gcs, bucket_name, response_path, response_data)
+        logger.info(f"Uploaded raw {api_name} response to {response_path}")
+
+    await asyncio.gather(*(_upload(name, data) for name, data in raw_responses.items()))
+
+
 def get_existing_articles_for_date(bucket_name: str, date_str: str) -> set:
     """
     Fetch all article URLs from existing runs for a given date.
@@ -184,16 +253,10 @@ def get_existing_articles_for_date(bucket_name: str, date_str: str) -> set:
             # Only process articles.json files
             if blob.name.endswith('/articles.json'):
                 try:
-                    content = blob.download_as_string()
-                    data = json.loads(content)
-                    articles = data.get('articles', [])
-
-                    for article in articles:
-                        url = article.get('original_url') or article.get('url')
-                        if url:
-                            existing_urls.add(url)
+                    urls = list(iter_article_urls(blob))
+                    existing_urls.update(urls)
 
-                    logger.info(f"Loaded {len(articles)} articles from {blob.name}")
+                    logger.info("Loaded %d article URLs from %s", len(urls), blob.name)
 
                 except json.JSONDecodeError as e:
                     logger.error(f"Cannot parse {blob.name}: {e}")
@@ -232,6 +295,7 @@ def publish_batch_processing_request(
     # Build success_messages array (like scraper_function does)
     success_messages = []
     total_articles = 0
+    processed_at = datetime.now(timezone.utc).isoformat()
 
     for file_info in session_files:
         success_messages.append({
@@ -240,7 +304,7 @@ def publish_batch_processing_request(
             'source_domain': file_info.get('source_domain', 'api_complete'),
             'articles_count': file_info.get('articles_count', 0),
             'triggered_by': triggered_by,
-            'processed_at': datetime.now(timezone.utc).isoformat()
+            'processed_at': processed_at
         })
         total_articles += file_info.get('articles_count', 0)
 
@@ -250,7 +314,7 @@ def publish_batch_processing_request(
         "run_id": run_id,
         "batch_size": len(success_messages),
         "success_messages": success_messages,
-        "batch_processed_at": datetime.now(timezone.utc).isoformat(),
+        "batch_processed_at": processed_at,
         "total_articles": total_articles
     }
 
@@ -424,11 +488,23 @@ async def fetch_and_store_news(message_data: dict) -> dict:
         time_range=time_range
     )
     
+    # Generate storage path (using CET timezone for run timestamps)
+    now = datetime.now(CET)
+    date_str = now.strftime('%Y-%m-%d')
+    run_id = now.strftime('%H-%M-%S')
+
+    # Load existing URLs for deduplication in a worker thread while the API
+    # fetches run; the blocking GCS listing/reads would otherwise stall the loop
+    existing_urls_task = asyncio.create_task(
+        asyncio.to_thread(get_existing_articles_for_date, GCS_BUCKET_NAME, date_str)
+    )
+
     # Fetch news
     try:
         articles = await aggregator.get_news(keywords=keywords)
         logger.info(f"Fetched {len(articles)} articles from APIs")
     except Exception as e:
+        existing_urls_task.cancel()
         logger.error(f"Error fetching news: {e}", exc_info=True)
         return {
             'status': 'error',
@@ -437,17 +513,13 @@ async def fetch_and_store_news(message_data: dict) -> dict:
         }
     
     if not articles:
+        existing_urls_task.cancel()
         logger.info("No articles found from APIs")
         return {
             'status': 'success',
             'articles_count': 0,
             'triggered_by': triggered_by
         }
-    
-    # Generate storage path (using CET timezone for run timestamps)
-    now = datetime.now(CET)
-    date_str = now.strftime('%Y-%m-%d')
-    run_id = now.strftime('%H-%M-%S')
 
     # Path structure: ingestion/YYYY-MM-DD/HH-MM-SS/
     base_path = f"{INGESTION_PREFIX}{date_str}/{run_id}"
@@ -462,7 +534,7 @@ async def fetch_and_store_news(message_data: dict) -> dict:
 
     # Fetch existing articles from same day (CRITICAL - will abort on error)
     try:
-        existing_urls = get_existing_articles_for_date(GCS_BUCKET_NAME, date_str)
+        existing_urls = await existing_urls_task
     except Exception as e:
         logger.error(f"CRITICAL: Cannot fetch existing articles for deduplication: {e}")
         return {
@@ -481,7 +553,7 @@ async def fetch_and_store_news(message_data: dict) -> dict:
             existing_urls.add(url)  # Track for this run too
         elif url:
             duplicate_urls.append(url)
-            logger.debug(f"Duplicate URL: {url}")
+            logger.debug("Duplicate URL: %s", url)
 
     logger.info(f"Deduplication: {len(processed_articles)} fetched, {len(unique_articles)} unique, {len(duplicate_urls)} duplicates")
 
@@ -517,7 +589,6 @@ async def fetch_and_store_news(message_data: dict) -> dict:
     logger.info(f"Incomplete articles: {len(incomplete_articles)}")
 
     # Transform complete articles to session schema and group by source
-    from collections import defaultdict
     articles_by_source = defaultdict(list)
 
     for article in complete_articles:
@@ -541,7 +612,7 @@ async def fetch_and_store_news(message_data: dict) -> dict:
     # Add all transformed articles
     for source_domain, source_articles in articles_by_source.items():
         session_data['articles'].extend(source_articles)
-        logger.info(f"  - {source_domain}: {len(source_articles)} complete articles")
+        logger.info("  - %s: %d complete articles", source_domain, len(source_articles))
 
     # Upload complete articles to complete_articles.json
     complete_articles_path = f"{base_path}/complete_articles.json"
@@ -592,15 +663,10 @@ async def fetch_and_store_news(message_data: dict) -> dict:
             'completed_at': datetime.now(timezone.utc).isoformat()
         }
         metadata_path = f"{base_path}/metadata.json"
-        upload_to_gcs(GCS_BUCKET_NAME, metadata_path, metadata)
+        upload_to_gcs(GCS_BUCKET_NAME, metadata_path, metadata, pretty=True)
 
         # Upload raw API responses
-        raw_responses = aggregator.get_raw_responses()
-        if raw_responses:
-            for api_name, response_data in raw_responses.items():
-                response_path = f"{base_path}/responses/{api_name}.json"
-                upload_to_gcs(GCS_BUCKET_NAME, response_path, response_data)
-                logger.info(f"Uploaded raw {api_name} response to {response_path}")
+        await upload_raw_responses(GCS_BUCKET_NAME, base_path, aggregator.get_raw_responses())
 
         logger.info("Scraper triggered. Exiting. Scraper will handle batch processing.")
         return {
@@ -643,15 +709,10 @@ async def fetch_and_store_news(message_data: dict) -> dict:
             'completed_at': datetime.now(timezone.utc).isoformat()
         }
         metadata_path = f"{base_path}/metadata.json"
-        upload_to_gcs(GCS_BUCKET_NAME, metadata_path, metadata)
+        upload_to_gcs(GCS_BUCKET_NAME, metadata_path, metadata, pretty=True)
 
         # Upload raw API responses
-        raw_responses = aggregator.get_raw_responses()
-        if raw_responses:
-            for api_name, response_data in raw_responses.items():
-                response_path = f"{base_path}/responses/{api_name}.json"
-                upload_to_gcs(GCS_BUCKET_NAME, response_path, response_data)
-                logger.info(f"Uploaded raw {api_name} response to {response_path}")
+        await upload_raw_responses(GCS_BUCKET_NAME, base_path, aggregator.get_raw_responses())
 
         logger.info(f"Successfully processed {len(processed_articles)} articles:")
         logger.info(f"  - Complete: {len(complete_articles)} (stored)")
@@ -5,19 +5,22 @@ Adapted from muhabir project for Cloud Function deployment.
 Supports: NewsAPI, WorldNewsAPI, GNews API
 """
 
-import os
-import hashlib
-import json
+import functools
 import logging
 import re
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set
+from typing import Awaitable, Callable, List, Dict, Optional, Set
+from urllib.parse import urlparse
 from enum import Enum
 import asyncio
 import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# API truncation marker at the end of content, e.g. "[+497 chars]" or "[497 chars]"
+TRUNCATION_MARKER_RE = re.compile(r'\[[\+]?\d+\s*chars?\]$')
+
 
 def is_content_complete(content: str) -> bool:
     """
@@ -38,19 +41,32 @@ def is_content_complete(content: str) -> bool:
 
     content_stripped = content.strip()
 
-    # Check for explicit truncation markers like "[+497 chars]" or "[497 chars]"
-    if re.search(r'\[[\+]?\d+\s*chars?\]$', content_stripped):
-        logger.debug(f"Content truncated (marker found): {content_stripped[-50:]}")
+    # Check for explicit truncation markers like "[+497 chars]" or "[497 chars]".
+    # The endswith test rules out most bodies without scanning them with the regex.
+    if content_stripped.endswith(']') and TRUNCATION_MARKER_RE.search(content_stripped):
+        logger.debug("Content truncated (marker found): %s", content_stripped[-50:])
         return False
 
     # Check for suspiciously short content
     if len(content_stripped) < 200:
-        logger.debug(f"Content suspiciously short: {len(content_stripped)} chars")
+        logger.debug("Content suspiciously short: %d chars", len(content_stripped))
         return False
 
     return True
 
 
+@functools.lru_cache(maxsize=1024)
+def source_name_for_domain(netloc: str) -> str:
+    """
+    Readable source name for a URL netloc, memoized per domain.
+
+    API results repeat a small set of publisher domains, so each one is
+    converted once (e.g. "www.fanatik.com.tr" -> "Fanatik").
+    """
+    domain = netloc.replace("www.", "")
+    return domain.split('.')[0].title() if domain else "Unknown"
+
+
 class TimeRangeEnum(str, Enum):
     """Time range options for news queries"""
     LAST_HOUR = "last_hour"
@@ -62,6 +78,17 @@ class TimeRangeEnum(str, Enum):
     CUSTOM = "custom"
 
 
+# Lookback window per time range; str-enum members hash like their values.
+TIME_RANGE_DELTAS: Dict[str, timedelta] = {
+    TimeRangeEnum.LAST_HOUR: timedelta(hours=1),
+    TimeRangeEnum.LAST_6_HOURS: timedelta(hours=6),
+    TimeRangeEnum.LAST_12_HOURS: timedelta(hours=12),
+    TimeRangeEnum.LAST_24_HOURS: timedelta(days=1),
+    TimeRangeEnum.LAST_WEEK: timedelta(days=7),
+    TimeRangeEnum.LAST_MONTH: timedelta(days=30),
+}
+
+
 class NewsAggregator:
     """News aggregator for fetching news from multiple APIs"""
     
@@ -87,15 +114,21 @@ class NewsAggregator:
         self.custom_start_date: Optional[str] = None
         self.custom_end_date: Optional[str] = None
         self.raw_responses: Dict[str, Dict] = {}  # Store raw API responses
+        self._session: Optional[aiohttp.ClientSession] = None  # Shared by get_news fetches
     
+    @asynccontextmanager
+    async def _client_session(self):
+        """Yield the session shared by get_news, or a short-lived one for direct calls."""
+        if self._session is not None:
+            yield self._session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
     def _extract_domain(self, url: str) -> str:
         """Extract domain name from URL for source attribution."""
         try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            domain = parsed.netloc.replace("www.", "")
-            # Convert domain to readable name (e.g., "thesun.co.uk" -> "The Sun")
-            return domain.split('.')[0].title() if domain else "Unknown"
+            return source_name_for_domain(urlparse(url).netloc)
         except Exception:
             return "Unknown"
         
@@ -156,18 +189,8 @@ class NewsAggregator:
                 "to": self.custom_end_date
             }
         
-        if self.time_range == TimeRangeEnum.LAST_HOUR:
-            from_date = now - timedelta(hours=1)
-        elif self.time_range == TimeRangeEnum.LAST_6_HOURS:
-            from_date = now - timedelta(hours=6)
-        elif self.time_range == TimeRangeEnum.LAST_12_HOURS:
-            from_date = now - timedelta(hours=12)
-        elif self.time_range == TimeRangeEnum.LAST_WEEK:
-            from_date = now - timedelta(days=7)
-        elif self.time_range == TimeRangeEnum.LAST_MONTH:
-            from_date = now - timedelta(days=30)
-        else:  # Default to last 24 hours
-            from_date = now - timedelta(days=1)
+        # Unknown ranges (incl. CUSTOM without dates) default to last 24 hours
+        from_date = now - TIME_RANGE_DELTAS.get(self.time_range, timedelta(days=1))
         
         # Return date-only format (YYYY-MM-DD) for WorldNewsAPI compatibility
         return {
@@ -204,7 +227,7 @@ class NewsAggregator:
             
         try:
             logger.info(f"Fetching from NewsAPI with query: {query}")
-            async with aiohttp.ClientSession() as session:
+            async with self._client_session() as session:
                 async with session.get(
                     "https://newsapi.org/v2/everything",
                     params=params,
@@ -229,6 +252,7 @@ class NewsAggregator:
                 'response': data
             }
 
+            language = self.languages[0] if self.languages else "en"
             articles = [{
                 "title": article.get("title") or "Untitled",
                 "url": article.get("url"),
@@ -239,7 +263,7 @@ class NewsAggregator:
                 "content": article.get("content") or article.get("description", ""),
                 "image_url": article.get("urlToImage"),
                 "api_source": "newsapi",
-                "language": self.languages[0] if self.languages else "en",
+                "language": language,
                 "categories": [],
                 "key_entities": {"competitions": [], "locations": [], "players": [], "teams": []},
                 "content_quality": "medium",
@@ -288,7 +312,7 @@ class NewsAggregator:
             
         try:
             logger.info(f"Fetching from WorldNewsAPI with query: {query}")
-            async with aiohttp.ClientSession() as session:
+            async with self._client_session() as session:
                 async with session.get(
                     "https://api.worldnewsapi.com/search-news",
                     params=params,
@@ -331,7 +355,7 @@ class NewsAggregator:
                 "url": article.get("url"),
                 "original_url": article.get("url"),
                 "source": article.get("source_name") or self._extract_domain(article.get("url", "")),
-                "publish_date": article.get("publish_date", "").replace(" ", "T") if article.get("publish_date") else "",
+                "publish_date": (article.get("publish_date") or "").replace(" ", "T"),
                 "summary": article.get("summary") or article.get("text", "")[:500] if article.get("text") else "",
                 "content": article.get("text", article.get("summary", "")),
                 "image_url": article.get("image"),
@@ -384,7 +408,7 @@ class NewsAggregator:
             
         try:
             logger.info(f"Fetching from GNews API with query: {query}")
-            async with aiohttp.ClientSession() as session:
+            async with self._client_session() as session:
                 async with session.get(
                     "https://gnews.io/api/v4/search",
                     params=params,
@@ -461,30 +485,35 @@ class NewsAggregator:
         if keywords:
             self.update_keywords(keywords)
 
-        # Build list of fetch tasks based on available API keys
-        tasks = []
+        # Build list of sources based on available API keys
+        sources = []
         if self.newsapi_key:
-            tasks.append(self.fetch_newsapi_articles())
+            sources.append(("newsapi", self.fetch_newsapi_articles))
         if self.worldnewsapi_key:
-            tasks.append(self.fetch_worldnewsapi_articles())
+            sources.append(("worldnewsapi", self.fetch_worldnewsapi_articles))
         if self.gnews_api_key:
-            tasks.append(self.fetch_gnews_articles())
+            sources.append(("gnews", self.fetch_gnews_articles))
         
-        if not tasks:
+        if not sources:
             logger.warning("No API sources available")
             return []
         
-        # Fetch from all sources concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Fetch from all sources concurrently over one ClientSession, so the
+        # connector (connection pool, DNS cache) is set up once per run.
+        # _fetch_source contains per-source failures, so one bad API does not
+        # cancel its siblings; anything else propagates out of the TaskGroup.
+        async with aiohttp.ClientSession() as session:
+            self._session = session
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(self._fetch_source(name, fetch), name=f"fetch_{name}")
+                        for name, fetch in sources
+                    ]
+            finally:
+                self._session = None
         
-        # Flatten results, handling exceptions
-        all_articles = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Error from source {i}: {result}")
-                continue
-            if result:
-                all_articles.extend(result)
+        all_articles = [article for task in tasks for article in task.result()]
         
         logger.info(f"Fetched {len(all_articles)} total articles from all sources")
         
@@ -494,15 +523,32 @@ class NewsAggregator:
         
         return sorted_articles
     
+    async def _fetch_source(self, name: str, fetch: Callable[[], Awaitable[List[Dict]]]) -> List[Dict]:
+        """
+        Run one source fetch, logging and swallowing its errors.
+
+        Args:
+            name: Source name for logging
+            fetch: Bound fetch_*_articles method
+
+        Returns:
+            Articles from the source, or an empty list on error
+        """
+        try:
+            return await fetch() or []
+        except Exception as e:
+            logger.error(f"Error from source {name}: {e}")
+            return []
+
     def deduplicate_articles(self, articles: List[Dict]) -> List[Dict]:
-        """Remove duplicate articles based on URL hash."""
+        """Remove duplicate articles based on URL."""
         unique_articles = []
         
         for article in articles:
-            article_hash = self._hash_article(article)
+            key = self._dedup_key(article)
             
-            if article_hash not in self.seen_articles:
-                self.seen_articles.add(article_hash)
+            if key not in self.seen_articles:
+                self.seen_articles.add(key)
                 unique_articles.append(article)
         
         logger.info(f"Deduplicated {len(articles)} -> {len(unique_articles)} unique articles")
@@ -516,7 +562,11 @@ class NewsAggregator:
             reverse=reverse
         )
     
-    def _hash_article(self, article: Dict) -> str:
-        """Create a hash for an article based on its URL."""
-        url = article.get("url", "")
-        return hashlib.md5(url.encode()).hexdigest()
+    def _dedup_key(self, article: Dict) -> str:
+        """
+        Return the in-memory dedup key for an article.
+
+        The URL is already a canonical string, so it is used as-is; hashing it
+        only added encode + digest work and a second string per article.
+        """
+        return article.get("url", "")
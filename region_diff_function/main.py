@@ -12,12 +12,10 @@ Flow:
 """
 
 import os
-import json
+import functools
 import logging
 import sys
-from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
-from typing import Dict, Any
 
 CET = ZoneInfo("Europe/Berlin")
 
@@ -63,6 +61,28 @@ TRIGGER_PATTERNS = [
 ]
 
 
+@functools.lru_cache(maxsize=4)
+def get_analyzer(bucket_name: str) -> RegionDiffAnalyzer:
+    """
+    Return the analyzer for event-triggered runs, reused across warm invocations.
+
+    Event runs always use the module-level diff settings, so one analyzer per
+    bucket serves every trigger instead of a new one per event.
+
+    Args:
+        bucket_name: GCS bucket from the triggering event
+
+    Returns:
+        RegionDiffAnalyzer instance
+    """
+    return RegionDiffAnalyzer(
+        storage_client=storage_client,
+        bucket_name=bucket_name,
+        diff_threshold=REGION_DIFF_THRESHOLD,
+        historical_diff_depth=HISTORICAL_DIFF_DEPTH
+    )
+
+
 def region_diff_handler(event, context):
     """
     Cloud Function entry point.
@@ -98,13 +118,7 @@ def region_diff_handler(event, context):
         run_folder = '/'.join(parts[:-1])  # ingestion/2025-12-22/08-37-29
         logger.info(f"Run folder: {run_folder}")
 
-        # Initialize analyzer
-        analyzer = RegionDiffAnalyzer(
-            storage_client=storage_client,
-            bucket_name=bucket,
-            diff_threshold=REGION_DIFF_THRESHOLD,
-            historical_diff_depth=HISTORICAL_DIFF_DEPTH
-        )
+        analyzer = get_analyzer(bucket)
 
         # Compute diff
         result = analyzer.get_diff(
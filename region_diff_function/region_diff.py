@@ -11,6 +11,7 @@ With HISTORICAL_DIFF_DEPTH > 1, compares new EU articles against TR articles
 from the last N days, not just the same run.
 """
 
+import base64
 import json
 import logging
 from datetime import datetime, timezone, timedelta
@@ -33,6 +34,9 @@ EMBEDDING_FILES = [
     'embeddings/scraped_incomplete_embeddings.json'
 ]
 
+# Packed embeddings column written by article_processor (see cross_run_dedup.py)
+EMBEDDINGS_DTYPE = '<f4'
+
 ARTICLE_FILES = [
     'enriched_scraped_articles.json',
     'enriched_complete_articles.json',
@@ -91,9 +95,17 @@ class RegionDiffAnalyzer:
             data = json.loads(content)
 
             article_ids = data.get("article_ids", [])
-            embeddings = np.array(data.get("embeddings", []))
+            encoded = data.get("embeddings_b64")
+            if encoded:
+                dim = data.get("embedding_dim") or 0
+                embeddings = np.frombuffer(base64.b64decode(encoded), dtype=EMBEDDINGS_DTYPE)
+                if dim:
+                    embeddings = embeddings.reshape(-1, dim)
+            else:
+                # Legacy format: JSON list of float lists
+                embeddings = np.array(data.get("embeddings", []))
 
-            logger.debug(f"Loaded {len(article_ids)} embeddings from {blob_path}")
+            logger.debug("Loaded %d embeddings from %s", len(article_ids), blob_path)
             return article_ids, embeddings
 
         except Exception as e:
@@ -122,13 +134,42 @@ class RegionDiffAnalyzer:
             else:
                 articles = data
 
-            logger.debug(f"Loaded {len(articles)} articles from {blob_path}")
+            logger.debug("Loaded %d articles from %s", len(articles), blob_path)
             return articles
 
         except Exception as e:
             logger.error(f"Error loading articles from {blob_path}: {e}")
             return []
 
+    def existing_run_files(self, run_folder: str, files: List[str]) -> List[str]:
+        """
+        Return the paths of the given run files that actually exist.
+
+        Lists each containing folder once (delimiter='/' keeps it to that
+        level) instead of attempting a download per candidate file; most runs
+        only have one of the scraped/complete/scraped_incomplete variants.
+
+        Args:
+            run_folder: GCS path to run folder (e.g., "ingestion/2025-12-22/08-37-29")
+            files: File names relative to the run folder
+
+        Returns:
+            Existing paths in the order of files (all paths if listing fails)
+        """
+        paths = [f"{run_folder}/{name}" for name in files]
+        prefixes = {path.rpartition('/')[0] + '/' for path in paths}
+
+        try:
+            bucket = self.storage_client.bucket(self.bucket_name)
+            present = set()
+            for prefix in prefixes:
+                present.update(blob.name for blob in bucket.list_blobs(prefix=prefix, delimiter='/'))
+        except Exception as e:
+            logger.warning(f"Could not list files in {run_folder}, trying all: {e}")
+            return paths
+
+        return [path for path in paths if path in present]
+
     def load_all_embeddings_from_run(self, run_folder: str) -> Tuple[List[str], np.ndarray]:
         """
         Load embeddings from all available embedding files in a run folder.
@@ -145,17 +186,18 @@ class RegionDiffAnalyzer:
         all_article_ids = []
         all_embeddings = []
 
-        for emb_file in EMBEDDING_FILES:
-            path = f"{run_folder}/{emb_file}"
+        for path in self.existing_run_files(run_folder, EMBEDDING_FILES):
             article_ids, embeddings = self.load_embeddings_from_gcs(path)
-            if len(article_ids) > 0:
-                logger.debug(f"Loaded {len(article_ids)} embeddings from {emb_file}")
+            if len(article_ids) > 0 and embeddings.size > 0:
+                logger.debug("Loaded %d embeddings from %s", len(article_ids), path)
                 all_article_ids.extend(article_ids)
-                all_embeddings.extend(embeddings)
+                # Keep each file's matrix as-is; one vstack below instead of
+                # splitting into row views and rebuilding with np.array
+                all_embeddings.append(embeddings)
 
         if all_embeddings:
             logger.info(f"Total {len(all_article_ids)} embeddings loaded from {run_folder}")
-            return all_article_ids, np.array(all_embeddings)
+            return all_article_ids, np.vstack(all_embeddings)
 
         return [], np.array([])
 
@@ -175,8 +217,7 @@ class RegionDiffAnalyzer:
         all_articles = []
         seen_ids = set()
 
-        for art_file in ARTICLE_FILES:
-            path = f"{run_folder}/{art_file}"
+        for path in self.existing_run_files(run_folder, ARTICLE_FILES):
             articles = self.load_articles_from_gcs(path)
             for article in articles:
                 aid = article.get('article_id')
@@ -243,7 +284,7 @@ class RegionDiffAnalyzer:
                     run_folder = prefix_path.rstrip('/')
                     run_folders.add(run_folder)
 
-            logger.debug(f"Found {len(run_folders)} run folders for {date}")
+            logger.debug("Found %d run folders for %s", len(run_folders), date)
 
         except Exception as e:
             logger.error(f"Error finding run folders for {date}: {e}")
@@ -266,9 +307,11 @@ class RegionDiffAnalyzer:
             Tuple of (region2_data list, region2_embeddings array)
         """
         historical_dates = self.get_historical_dates(current_run_folder)
-        all_region2_data = []  # (article_id, embedding)
-        all_region2_embeddings = []
+        all_region2_data = []  # (article_id, embedding_index, article)
+        all_region2_embeddings = []  # One matrix per run folder, stacked once at the end
+        total_rows = 0
         seen_article_ids = set()
+        region2_key = region2.lower()
 
         for date in historical_dates:
             run_folders = self.find_run_folders_for_date(date)
@@ -290,7 +333,9 @@ class RegionDiffAnalyzer:
                 # Create article_id to article mapping
                 article_map = {a.get('article_id'): a for a in articles}
 
-                # Filter for region2 articles only
+                # Filter for region2 articles only; collect row indices and take
+                # them with one fancy-index instead of copying rows one by one
+                selected_rows = []
                 for idx, article_id in enumerate(article_ids):
                     # Skip if we've already seen this article
                     if article_id in seen_article_ids:
@@ -301,13 +346,17 @@ class RegionDiffAnalyzer:
                         continue
 
                     region = article.get('region', '').lower()
-                    if region == region2.lower():
+                    if region == region2_key:
                         seen_article_ids.add(article_id)
-                        all_region2_data.append((article_id, len(all_region2_embeddings), article))
-                        all_region2_embeddings.append(embeddings[idx])
+                        all_region2_data.append((article_id, total_rows + len(selected_rows), article))
+                        selected_rows.append(idx)
+
+                if selected_rows:
+                    all_region2_embeddings.append(embeddings[selected_rows])
+                    total_rows += len(selected_rows)
 
         if all_region2_embeddings:
-            embeddings_array = np.array(all_region2_embeddings)
+            embeddings_array = np.vstack(all_region2_embeddings)
         else:
             embeddings_array = np.array([])
 
@@ -400,6 +449,7 @@ class RegionDiffAnalyzer:
 
         # Extract region1 (EU) articles from current run
         region1_data = []  # (article_id, embedding_index, article)
+        region1_key = region1.lower()
 
         for idx, article_id in enumerate(article_ids):
             article = article_map.get(article_id)
@@ -407,7 +457,7 @@ class RegionDiffAnalyzer:
                 continue
 
             region = article.get('region', '').lower()
-            if region == region1.lower():
+            if region == region1_key:
                 region1_data.append((article_id, idx, article))
 
         logger.info(f"Found {len(region1_data)} {region1} articles in current run")
@@ -62,6 +62,43 @@ BROWSER_SERVICE_URL = os.getenv('BROWSER_SERVICE_URL')  # URL of Browser Render
 BROWSER_SERVICE_API_KEY_SECRET_ID = os.getenv('BROWSER_SERVICE_API_KEY_SECRET_ID', 'BROWSER_SERVICE_API_KEY')
 BROWSER_SERVICE_MAX_SCROLLS = int(os.getenv('BROWSER_SERVICE_MAX_SCROLLS', '20'))  # Max scroll iterations
 
+# publish_date formats grouped by the separator that distinguishes them, so a
+# date string is only tried against formats that can possibly match it
+PUBLISH_DATE_FORMATS = {
+    'T': (
+        '%Y-%m-%dT%H:%M:%S.%f%z',  # ISO with microseconds and tz
+        '%Y-%m-%dT%H:%M:%S%z',      # ISO with tz
+        '%Y-%m-%dT%H:%M:%S.%f',     # ISO with microseconds, no tz
+        '%Y-%m-%dT%H:%M:%S',        # ISO without tz
+    ),
+    '/': (
+        '%d/%m/%Y %H:%M:%S',        # European format
+        '%d/%m/%Y',                  # European date only
+        '%m/%d/%Y %H:%M:%S',        # US format
+        '%m/%d/%Y',                  # US date only
+    ),
+    '-': (
+        '%Y-%m-%d %H:%M:%S',        # Common datetime format
+        '%Y-%m-%d',                  # Date only
+    ),
+}
+
+
+def log_tmp_directory_state() -> None:
+    """
+    Log /tmp contents around a write probe to diagnose filesystem access.
+
+    Only called at DEBUG level: it lists /tmp twice and writes a file, which
+    is wasted I/O on every scraping request otherwise.
+    """
+    logger.debug("/tmp contents before: %s", [str(p) for p in Path("/tmp").iterdir()])
+
+    test_file = Path("/tmp/test")
+    test_file.write_text("dummy")
+    logger.debug("Created test file at %s", test_file)
+
+    logger.debug("/tmp contents after: %s", [str(p) for p in Path("/tmp").iterdir()])
+
 
 def access_secret(secret_id: str, version_id: str = "latest") -> str:
     """Access a secret from Google Cloud Secret Manager."""
@@ -83,6 +120,9 @@ def access_secret(secret_id: str, version_id: str = "latest") -> str:
 # Valid regions for scraping
 VALID_REGIONS = {'eu', 'tr'}
 
+# Fields search_parameters.json must define for local runs
+REQUIRED_SEARCH_PARAMETERS = frozenset({"keywords", "urls", "scrape_depth"})
+
 # Output file names
 OUTPUT_FILE_API_TRIGGERED = 'scraped_incomplete_articles.json'
 OUTPUT_FILE_STANDALONE = 'scraped_articles.json'
@@ -124,6 +164,16 @@ def validate_scraping_request(message_data: dict) -> tuple:
 # METADATA HELPERS
 # =============================================================================
 
+def download_json_if_exists(blob) -> dict | None:
+    """Download and parse a JSON blob, returning None if it does not exist (404)."""
+    try:
+        return json.loads(blob.download_as_bytes())
+    except Exception as e:
+        if getattr(e, 'code', None) == 404:
+            return None
+        raise
+
+
 def load_article_metadata_from_gcs(bucket_name: str, api_run_path: str) -> dict:
     """
     Load article metadata from to_scrape.json.
@@ -149,11 +199,11 @@ def load_article_metadata_from_gcs(bucket_name: str, api_run_path: str) -> dict:
         bucket = storage_client.bucket(bucket_name)
         blob = bucket.blob(to_scrape_path)
         
-        if not blob.exists():
+        to_scrape_data = download_json_if_exists(blob)
+        if to_scrape_data is None:
             logger.info(f"No to_scrape.json found at {to_scrape_path} (standalone mode)")
             return url_metadata
         
-        to_scrape_data = json.loads(blob.download_as_string())
         for article in to_scrape_data.get('articles', []):
             url = article.get('url')
             if url:
@@ -252,19 +302,25 @@ def normalize_publish_date(date_value) -> str:
         if 'T' in date_str and ('+' in date_str or 'Z' in date_str or date_str.endswith('+00:00')):
             return date_str
         
-        # Try parsing various formats
-        formats_to_try = [
-            '%Y-%m-%dT%H:%M:%S.%f%z',  # ISO with microseconds and tz
-            '%Y-%m-%dT%H:%M:%S%z',      # ISO with tz
-            '%Y-%m-%dT%H:%M:%S.%f',     # ISO with microseconds, no tz
-            '%Y-%m-%dT%H:%M:%S',        # ISO without tz
-            '%Y-%m-%d %H:%M:%S',        # Common datetime format
-            '%Y-%m-%d',                  # Date only
-            '%d/%m/%Y %H:%M:%S',        # European format
-            '%d/%m/%Y',                  # European date only
-            '%m/%d/%Y %H:%M:%S',        # US format
-            '%m/%d/%Y',                  # US date only
-        ]
+        # ISO-style dates (the bulk of journalist output) parse in C via
+        # fromisoformat; strptime below only handles the remaining formats
+        if '-' in date_str and '/' not in date_str:
+            try:
+                parsed = datetime.fromisoformat(date_str)
+            except ValueError:
+                pass
+            else:
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                return parsed.isoformat()
+        
+        # Try parsing the formats that share this string's separator
+        if 'T' in date_str:
+            formats_to_try = PUBLISH_DATE_FORMATS['T']
+        elif '/' in date_str:
+            formats_to_try = PUBLISH_DATE_FORMATS['/']
+        else:
+            formats_to_try = PUBLISH_DATE_FORMATS['-']
         
         for fmt in formats_to_try:
             try:
@@ -368,6 +424,13 @@ def is_first_run_of_day(storage_client, bucket_name, date_obj, region="eu"):
         # Default to False (assume not first run) to avoid over-fetching
         return False
 
+def iter_session_article_urls(session_data: dict):
+    """Iterate the URL of each article in session data (url, link or original_url)."""
+    return filter(None, (
+        article.get("url") or article.get("link") or article.get("original_url")
+        for article in session_data.get("articles", [])
+    ))
+
 def get_processed_urls_last_n_days(storage_client, bucket_name, date_obj, region="eu", days=7):
     """
     Retrieves a set of already processed URLs from source session data for the last N days.
@@ -408,12 +471,7 @@ def get_processed_urls_last_n_days(storage_client, bucket_name, date_obj, region
                     content = blob.download_as_text()
                     data = json.loads(content)
                     
-                    articles = data.get("articles", [])
-                    for article in articles:
-                        # Check various common fields for URL
-                        url = article.get("url") or article.get("link") or article.get("original_url")
-                        if url:
-                            processed_urls.add(url)
+                    processed_urls.update(iter_session_article_urls(data))
                             
                 except Exception as e:
                     logger.warning(f"Error reading/parsing blob {blob.name}: {e}")
@@ -459,12 +517,7 @@ def get_processed_urls_for_date(storage_client, bucket_name, date_obj, region="e
                 content = blob.download_as_text()
                 data = json.loads(content)
                 
-                articles = data.get("articles", [])
-                for article in articles:
-                    # Check various common fields for URL
-                    url = article.get("url") or article.get("link") or article.get("original_url")
-                    if url:
-                        processed_urls.add(url)
+                processed_urls.update(iter_session_article_urls(data))
                         
             except Exception as e:
                 logger.warning(f"Error reading/parsing blob {blob.name}: {e}")
@@ -567,19 +620,9 @@ async def _process_scraping_request(message_data: dict):
         logger.info("Starting scraping operation...")
         logger.info("=== JOURNALIST SCRAPING BEGINS ===")
         
-        # List /tmp directory contents
-        tmp_contents_before = list(Path("/tmp").iterdir())
-        logger.info(f"/tmp contents before: {[str(p) for p in tmp_contents_before]}")
-        
-        # Create test file
-        test_file = Path("/tmp/test")
-        test_file.write_text("dummy")
-        logger.info(f"Created test file at {test_file}")
-        
-        # List /tmp directory contents again
-        tmp_contents_after = list(Path("/tmp").iterdir())
-        logger.info(f"/tmp contents after: {[str(p) for p in tmp_contents_after]}")
-        
+        if logger.isEnabledFor(logging.DEBUG):
+            log_tmp_directory_state()
+
 
         source_sessions = await journalist.read(
             urls=urls, 
@@ -598,8 +641,7 @@ async def _process_scraping_request(message_data: dict):
         # Log source_domain for each session after evaluation
         logger.info("=== SOURCE DOMAINS FOR EACH SESSION ===")
         for i, session in enumerate(source_sessions):
-            source_domain = session.get("source_domain", "unknown_source")
-            logger.info(f"source_sessions[{i}][\"source_domain\"] = {source_domain}")
+            logger.info('source_sessions[%d]["source_domain"] = %s', i, session.get("source_domain", "unknown_source"))
         logger.info("=== END SOURCE DOMAINS ===")
 
         # API Integration mode (or Standalone mode mimicking API structure)
@@ -619,7 +661,8 @@ async def _process_scraping_request(message_data: dict):
             # MERGE SESSIONS AND APPLY METADATA
             # ==========================================================================
             all_articles = []
-            source_domains = []
+            # dict keys give O(1) dedup while keeping first-seen order
+            source_domains = {}
 
             for session in source_sessions:
                 articles = session.get("articles", [])
@@ -628,9 +671,7 @@ async def _process_scraping_request(message_data: dict):
                 apply_metadata_to_articles(articles, url_metadata, fallback_region=region, fallback_keywords=keywords)
                         
                 all_articles.extend(articles)
-                source_domain = session.get("source_domain", "unknown")
-                if source_domain not in source_domains:
-                    source_domains.append(source_domain)
+                source_domains.setdefault(session.get("source_domain", "unknown"), None)
 
             # Prepare upload data in session schema format
             upload_data = {
@@ -640,7 +681,7 @@ async def _process_scraping_request(message_data: dict):
                 'session_metadata': {
                     'session_id': f"scraper_{run_id}",
                     'scraped_at': datetime.now(timezone.utc).isoformat(),
-                    'source_domains': source_domains,
+                    'source_domains': list(source_domains),
                     'source_count': len(source_domains),
                     'extraction_method': 'journalist',
                     'triggered_by': triggered_by,
@@ -685,7 +726,7 @@ async def _process_scraping_request(message_data: dict):
                     bucket = storage_client.bucket(GCS_BUCKET_NAME)
                     blob = bucket.blob(scraped_file_path)
                     blob.upload_from_string(
-                        json.dumps(upload_data, indent=2, ensure_ascii=False),
+                        json.dumps(upload_data, ensure_ascii=False),
                         content_type='application/json'
                     )
                     logger.info(f"✓ Saved scraped articles to gs://{GCS_BUCKET_NAME}/{scraped_file_path}")
@@ -699,7 +740,8 @@ async def _process_scraping_request(message_data: dict):
             api_run_id = api_run_path.split('/')[-1] if '/' in api_run_path else run_id
 
             # Publish to SESSION_DATA_CREATED_TOPIC
-            
+            processed_at = datetime.now(timezone.utc).isoformat()
+
             success_messages_list = [
                 {
                     'status': 'success',
@@ -707,7 +749,7 @@ async def _process_scraping_request(message_data: dict):
                     'source_domain': 'scraped' if is_standalone else 'api_scraped',
                     'articles_count': len(all_articles),
                     'triggered_by': triggered_by,
-                    'processed_at': datetime.now(timezone.utc).isoformat()
+                    'processed_at': processed_at
                 }
             ]
             
@@ -719,7 +761,7 @@ async def _process_scraping_request(message_data: dict):
                     'gcs_path': f"gs://{GCS_BUCKET_NAME}/{complete_file_path}",
                     'source_domain': 'api_complete',
                     'triggered_by': triggered_by,
-                    'processed_at': datetime.now(timezone.utc).isoformat()
+                    'processed_at': processed_at
                 })
 
             batch_message = {
@@ -727,7 +769,7 @@ async def _process_scraping_request(message_data: dict):
                 'run_id': api_run_id,
                 'batch_size': len(success_messages_list),
                 'success_messages': success_messages_list,
-                'batch_processed_at': datetime.now(timezone.utc).isoformat(),
+                'batch_processed_at': processed_at,
                 'total_articles': len(all_articles)
             }
 
@@ -735,7 +777,7 @@ async def _process_scraping_request(message_data: dict):
                 try:
                     logger.info(f"Publishing batch message to SESSION_DATA_CREATED_TOPIC with {len(success_messages_list)} files:")
                     for msg in success_messages_list:
-                        logger.info(f"  - {msg['gcs_path']}")
+                        logger.info("  - %s", msg['gcs_path'])
 
                     topic_path = publisher.topic_path(PROJECT_ID, SESSION_DATA_CREATED_TOPIC)
                     future = publisher.publish(topic_path, json.dumps(batch_message).encode("utf-8"))
@@ -821,10 +863,9 @@ def get_test_data():
             test_data = json.load(f)
         
         # Ensure required fields are present
-        required_fields = ["keywords", "urls", "scrape_depth"]
-        for field in required_fields:
-            if field not in test_data:
-                raise ValueError(f"Required field '{field}' missing from search_parameters.json")
+        missing_fields = REQUIRED_SEARCH_PARAMETERS - test_data.keys()
+        if missing_fields:
+            raise ValueError(f"Required fields {sorted(missing_fields)} missing from search_parameters.json")
         
         # Set default values for optional fields
         test_data.setdefault("persist", True)  # Enable persist for local testing
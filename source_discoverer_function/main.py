@@ -13,6 +13,8 @@ import os
 import sys
 import json
 import base64
+import functools
+import heapq
 import logging
 from datetime import datetime, timezone
 from typing import Set, List, Dict, Any, Optional
@@ -38,6 +40,9 @@ GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', 'aisports-scraping')
 USER_PREFERENCES_PREFIX = 'config/user_preferences/'
 DISCOVERED_SOURCES_PATH = 'config/discovered_sources.json'
 
+# Conditional-write retries for discovered_sources.json
+APPEND_MAX_ATTEMPTS = 3
+
 # Initialize clients
 if ENVIRONMENT != 'local':
     storage_client = storage.Client()
@@ -46,10 +51,14 @@ else:
     logger.info("Running in local environment - skipping Google Cloud client initialization")
 
 
+@functools.lru_cache(maxsize=16384)
 def extract_fqdn(url: str) -> Optional[str]:
     """
     Extract FQDN from URL, removing path and www prefix.
 
+    Memoized: the same URLs appear in both complete_articles.json and
+    to_scrape.json, so repeats skip urlparse.
+
     Examples:
         "https://www.sport1.de/channel/transfermarkt" → "sport1.de"
         "https://allnigeriasoccer.com/article" → "allnigeriasoccer.com"
@@ -77,12 +86,17 @@ def extract_fqdn(url: str) -> Optional[str]:
 
 def extract_unique_fqdns(urls: List[str]) -> Set[str]:
     """Extract unique FQDNs from a list of URLs."""
-    fqdns = set()
-    for url in urls:
-        fqdn = extract_fqdn(url)
-        if fqdn:
-            fqdns.add(fqdn)
-    return fqdns
+    return set(filter(None, map(extract_fqdn, urls)))
+
+
+def download_json_if_exists(blob) -> Optional[Any]:
+    """Download and parse a JSON blob, returning None if it does not exist (404)."""
+    try:
+        return json.loads(blob.download_as_bytes())
+    except Exception as e:
+        if getattr(e, 'code', None) == 404:
+            return None
+        raise
 
 
 def read_gcs_json(path: str) -> Dict[str, Any]:
@@ -95,12 +109,12 @@ def read_gcs_json(path: str) -> Dict[str, Any]:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(path)
 
-        if not blob.exists():
+        data = download_json_if_exists(blob)
+        if data is None:
             logger.info(f"File does not exist: {path}")
             return {}
 
-        content = blob.download_as_text()
-        return json.loads(content)
+        return data
     except Exception as e:
         logger.error(f"Error reading {path}: {e}")
         return {}
@@ -168,40 +182,71 @@ def append_discovered_sources(new_fqdns: Set[str]) -> bool:
     """
     Append new FQDNs to discovered_sources.json.
     Creates the file if it doesn't exist.
+
+    The write is conditional on the generation that was read, so two
+    concurrent discovery runs cannot silently overwrite each other's
+    appends; on a precondition conflict the file is re-read and retried.
     """
     if not storage_client or not new_fqdns:
         return False
 
     try:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
-        blob = bucket.blob(DISCOVERED_SOURCES_PATH)
-
-        # Load existing data or create new structure
-        if blob.exists():
-            existing = json.loads(blob.download_as_text())
-        else:
-            existing = {'discovered': [], 'last_updated': None}
 
-        # Get current timestamp
-        now = datetime.now(timezone.utc).isoformat()
+        for attempt in range(1, APPEND_MAX_ATTEMPTS + 1):
+            # get_blob returns None if missing, otherwise a blob with generation populated
+            blob = bucket.get_blob(DISCOVERED_SOURCES_PATH)
+
+            # Load existing data or create new structure
+            if blob is not None:
+                existing = json.loads(blob.download_as_text())
+                generation = blob.generation
+            else:
+                blob = bucket.blob(DISCOVERED_SOURCES_PATH)
+                existing = {'discovered': [], 'last_updated': None}
+                generation = 0  # Only create if still absent
+
+            # A concurrent run may already have appended some of these FQDNs
+            already_discovered = {
+                entry.get('fqdn') for entry in existing.get('discovered', [])
+            }
+            to_append = new_fqdns - already_discovered
+            if not to_append:
+                logger.info(f"All new FQDNs already present in {DISCOVERED_SOURCES_PATH}")
+                return True
+
+            # Get current timestamp
+            now = datetime.now(timezone.utc).isoformat()
+
+            # Append new FQDNs
+            for fqdn in sorted(to_append):
+                existing['discovered'].append({
+                    'fqdn': fqdn,
+                    'first_seen': now
+                })
+
+            existing['last_updated'] = now
+
+            # Save back to GCS
+            try:
+                blob.upload_from_string(
+                    json.dumps(existing, indent=2, ensure_ascii=False),
+                    content_type='application/json',
+                    if_generation_match=generation
+                )
+            except Exception as e:
+                if getattr(e, 'code', None) == 412 and attempt < APPEND_MAX_ATTEMPTS:
+                    logger.warning(
+                        f"{DISCOVERED_SOURCES_PATH} changed concurrently, retrying "
+                        f"(attempt {attempt}/{APPEND_MAX_ATTEMPTS})"
+                    )
+                    continue
+                raise
+
+            logger.info(f"Appended {len(to_append)} new FQDNs to {DISCOVERED_SOURCES_PATH}")
+            return True
 
-        # Append new FQDNs
-        for fqdn in sorted(new_fqdns):
-            existing['discovered'].append({
-                'fqdn': fqdn,
-                'first_seen': now
-            })
-
-        existing['last_updated'] = now
-
-        # Save back to GCS
-        blob.upload_from_string(
-            json.dumps(existing, indent=2, ensure_ascii=False),
-            content_type='application/json'
-        )
-
-        logger.info(f"Appended {len(new_fqdns)} new FQDNs to {DISCOVERED_SOURCES_PATH}")
-        return True
+        return False
 
     except Exception as e:
         logger.error(f"Error appending to discovered_sources.json: {e}")
@@ -249,16 +294,16 @@ def _process_discovery_request(message_data: Dict[str, Any]) -> None:
 
     # Extract unique FQDNs
     fqdns = extract_unique_fqdns(all_urls)
-    logger.info(f"Extracted {len(fqdns)} unique FQDNs: {sorted(fqdns)[:10]}...")
+    logger.info(f"Extracted {len(fqdns)} unique FQDNs: {heapq.nsmallest(10, fqdns)}...")
 
-    # Load known sources from user preferences
-    known_fqdns = load_known_fqdns_from_preferences()
-
-    # Load already-discovered FQDNs
-    already_discovered = load_discovered_fqdns()
-
-    # Filter to only truly new FQDNs
-    new_fqdns = fqdns - known_fqdns - already_discovered
+    # Filter cheapest first and stop as soon as nothing is left: the discovered
+    # list is a single file, while known sources mean reading every user's
+    # preferences file
+    new_fqdns = fqdns
+    if new_fqdns:
+        new_fqdns = new_fqdns - load_discovered_fqdns()
+    if new_fqdns:
+        new_fqdns = new_fqdns - load_known_fqdns_from_preferences()
 
     if new_fqdns:
         logger.info(f"Discovered {len(new_fqdns)} NEW sources: {sorted(new_fqdns)}")
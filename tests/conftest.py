@@ -70,7 +70,9 @@ class MockBucket:
             self._blobs[blob_path] = MockBlob(blob_path)
         return self._blobs[blob_path]
 
-    def list_blobs(self, prefix: str = "", max_results: int = None, delimiter: str = None):
+    def list_blobs(self, prefix: str = "", max_results: int = None, delimiter: str = None,
+                   match_glob: str = None):
+        # match_glob is a server-side narrowing only; callers re-filter names client-side
         matching = [b for b in self._blobs.values() if b.name.startswith(prefix)]
         if max_results:
             matching = matching[:max_results]
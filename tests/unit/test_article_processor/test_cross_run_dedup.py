@@ -428,4 +428,133 @@ class TestFallbackThreshold:
         custom = {'eu': 0.75, 'tr': 0.6}
         dedup = CrossRunDeduplicator(mock_client, 'bucket', region_thresholds=custom)
         
-        assert dedup.fallback_threshold == 0.75
\ No newline at end of file
+        assert dedup.fallback_threshold == 0.75
+
+class TestListPreviousEmbeddingFiles:
+    """Tests for list_previous_embedding_files."""
+
+    def _blob(self, name):
+        blob = MagicMock()
+        blob.name = name
+        return blob
+
+    def test_lists_with_embeddings_glob(self):
+        """Test listing is narrowed server-side to embedding files."""
+        from article_processor_function.cross_run_dedup import CrossRunDeduplicator
+
+        mock_client = MagicMock()
+        bucket = mock_client.bucket.return_value
+        bucket.list_blobs.return_value = []
+        dedup = CrossRunDeduplicator(mock_client, 'bucket')
+
+        dedup.list_previous_embedding_files('2025-01-02', '10-00-00')
+
+        bucket.list_blobs.assert_called_once_with(
+            prefix='ingestion/2025-01-02/',
+            match_glob='ingestion/2025-01-02/*/embeddings/*_embeddings.json'
+        )
+
+    def test_skips_current_run_and_non_embeddings(self):
+        """Test current run and unrelated files are excluded."""
+        from article_processor_function.cross_run_dedup import CrossRunDeduplicator
+
+        mock_client = MagicMock()
+        mock_client.bucket.return_value.list_blobs.return_value = [
+            self._blob('ingestion/2025-01-02/08-00-00/embeddings/complete_embeddings.json'),
+            self._blob('ingestion/2025-01-02/10-00-00/embeddings/complete_embeddings.json'),
+            self._blob('ingestion/2025-01-02/08-00-00/singleton_complete_articles.json'),
+        ]
+        dedup = CrossRunDeduplicator(mock_client, 'bucket')
+
+        files = dedup.list_previous_embedding_files('2025-01-02', '10-00-00')
+
+        assert files == ['ingestion/2025-01-02/08-00-00/embeddings/complete_embeddings.json']
+
+
+class TestEmbeddingsEncoding:
+    """Tests for packed embeddings storage."""
+
+    def test_save_then_load_round_trip(self, mock_storage_client):
+        """Test saved embeddings load back with the same values."""
+        from article_processor_function.cross_run_dedup import CrossRunDeduplicator
+
+        dedup = CrossRunDeduplicator(mock_storage_client, 'bucket')
+        embeddings = np.array([[0.1, 0.2, 0.3], [-1.0, 0.5, 2.0]])
+
+        dedup.save_embeddings(['a', 'b'], ['u1', 'u2'], embeddings, 'emb.json')
+        ids, urls, titles, loaded = dedup.load_embeddings_from_gcs('emb.json')
+
+        assert ids == ['a', 'b']
+        assert urls == ['u1', 'u2']
+        assert loaded.shape == (2, 3)
+        np.testing.assert_allclose(loaded, embeddings, rtol=1e-6)
+
+    def test_saved_file_uses_packed_column(self, mock_storage_client):
+        """Test saved file stores a base64 column instead of float lists."""
+        import json
+        from article_processor_function.cross_run_dedup import CrossRunDeduplicator
+
+        dedup = CrossRunDeduplicator(mock_storage_client, 'bucket')
+        dedup.save_embeddings(['a'], ['u'], np.ones((1, 4)), 'emb.json')
+
+        data = json.loads(mock_storage_client.bucket('bucket').blob('emb.json').download_as_text())
+        assert 'embeddings' not in data
+        assert data['embedding_encoding'] == 'float32-le-base64'
+        assert data['embedding_dim'] == 4
+
+    def test_decode_legacy_list_format(self):
+        """Test files written before packing are still readable."""
+        from article_processor_function.cross_run_dedup import decode_embeddings
+
+        result = decode_embeddings({'embeddings': [[1.0, 2.0], [3.0, 4.0]]})
+        np.testing.assert_array_equal(result, np.array([[1.0, 2.0], [3.0, 4.0]]))
+
+    def test_filtered_load_with_packed_column(self, mock_storage_client):
+        """Test content_lengths filtering works on packed embeddings."""
+        from article_processor_function.cross_run_dedup import CrossRunDeduplicator
+
+        dedup = CrossRunDeduplicator(mock_storage_client, 'bucket')
+        dedup.save_embeddings(
+            ['a', 'b'], ['u1', 'u2'], np.array([[1.0, 0.0], [0.0, 1.0]]), 'emb.json',
+            titles=['t1', 't2'], content_lengths=[10, 500]
+        )
+        ids, urls, titles, loaded = dedup.load_embeddings_from_gcs('emb.json')
+
+        assert ids == ['b']
+        np.testing.assert_array_equal(loaded, np.array([[0.0, 1.0]], dtype=np.float32))
+
+
+class TestLoadAllPreviousEmbeddings:
+    """Tests for load_all_previous_embeddings."""
+
+    def test_combines_files_in_listing_order(self, mock_storage_client):
+        """Test concurrent loads are combined in the order files were listed."""
+        from unittest.mock import patch
+        from article_processor_function.cross_run_dedup import CrossRunDeduplicator
+
+        dedup = CrossRunDeduplicator(mock_storage_client, 'bucket')
+        paths = [f'emb{i}.json' for i in range(5)]
+        for i, path in enumerate(paths):
+            dedup.save_embeddings([f'id{i}'], [f'u{i}'], np.full((1, 2), float(i)), path)
+
+        with patch.object(dedup, 'list_previous_embedding_files', return_value=paths):
+            ids, urls, titles, combined = dedup.load_all_previous_embeddings('2025-01-02', '10-00-00')
+
+        assert ids == [f'id{i}' for i in range(5)]
+        assert urls == [f'u{i}' for i in range(5)]
+        assert combined.shape == (5, 2)
+        np.testing.assert_array_equal(combined[:, 0], np.arange(5, dtype=np.float32))
+
+    def test_skips_failed_files(self, mock_storage_client):
+        """Test unreadable files are dropped without affecting the others."""
+        from unittest.mock import patch
+        from article_processor_function.cross_run_dedup import CrossRunDeduplicator
+
+        dedup = CrossRunDeduplicator(mock_storage_client, 'bucket')
+        dedup.save_embeddings(['a'], ['u'], np.ones((1, 3)), 'good.json')
+
+        with patch.object(dedup, 'list_previous_embedding_files', return_value=['missing.json', 'good.json']):
+            ids, urls, titles, combined = dedup.load_all_previous_embeddings('2025-01-02', '10-00-00')
+
+        assert ids == ['a']
+        assert combined.shape == (1, 3)
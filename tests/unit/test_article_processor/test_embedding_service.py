@@ -152,6 +152,47 @@ class TestGenerateEmbeddings:
         
         assert service.client.models.embed_content.call_count == 2
 
+    def test_duplicate_texts_embedded_once(self, service):
+        """Should embed identical texts once and map rows back to each article."""
+        def embed(model, contents, config):
+            response = Mock()
+            response.embeddings = [Mock(values=[float(len(text))]) for text in contents]
+            return response
+
+        service.client.models.embed_content = Mock(side_effect=embed)
+        articles = [{"title": "aa"}, {"title": "b"}, {"title": "aa"}]
+
+        result = service.generate_embeddings(articles)
+
+        assert service.client.models.embed_content.call_args.kwargs['contents'] == ["aa", "b"]
+        assert result.tolist() == [[2.0], [1.0], [2.0]]
+
+    def test_concurrent_batches_keep_order(self, service):
+        """Should return rows in article order when batches run concurrently."""
+        def embed(model, contents, config):
+            response = Mock()
+            response.embeddings = [Mock(values=[float(text.split()[1])]) for text in contents]
+            return response
+
+        service.client.models.embed_content = Mock(side_effect=embed)
+        articles = [{"title": f"Article {i}"} for i in range(service.BATCH_SIZE * 3 + 5)]
+
+        result = service.generate_embeddings(articles)
+
+        assert service.client.models.embed_content.call_count == 4
+        assert result[:, 0].tolist() == [float(i) for i in range(len(articles))]
+
+    def test_reuses_embed_config(self, service):
+        """Should pass the config built at init to every batch call."""
+        mock_response = Mock()
+        mock_response.embeddings = [Mock(values=[0.1])] * service.BATCH_SIZE
+        service.client.models.embed_content = Mock(return_value=mock_response)
+
+        service.generate_embeddings([{"title": f"Article {i}"} for i in range(50)])
+
+        configs = [c.kwargs['config'] for c in service.client.models.embed_content.call_args_list]
+        assert configs == [service.embed_config, service.embed_config]
+
     def test_raises_on_client_error(self, service):
         """Should raise exception on client error."""
         service.client.models.embed_content = Mock(side_effect=Exception("API Error"))
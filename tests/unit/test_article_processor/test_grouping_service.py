@@ -52,6 +52,13 @@ class TestArticleGroup:
         group = ArticleGroup(group_id=0, article_indices=[0, 1], max_similarity=0.95)
         assert group.max_similarity == 0.95
 
+    def test_is_frozen_and_slotted(self):
+        """Test that groups are immutable and carry no instance __dict__."""
+        group = ArticleGroup(group_id=0, article_indices=[0])
+        assert not hasattr(group, "__dict__")
+        with pytest.raises(AttributeError):
+            group.max_similarity = 0.5
+
 
 class TestUnionFind:
     """Tests for Union-Find data structure."""
@@ -6,6 +6,7 @@ Tests the LLM processor batch request creation and response parsing logic.
 
 import pytest
 import json
+import os
 from unittest.mock import Mock, MagicMock, patch
 from pathlib import Path
 import sys
@@ -27,8 +28,8 @@ mock_google_cloud = MagicMock()
 mock_google_cloud.storage = mock_storage
 sys.modules['google.cloud'] = mock_google_cloud
 
-from article_processor_function.llm_processor import LLMProcessor
-from article_processor_function.grouping_service import ArticleGroup
+from article_processor_function.llm_processor import LLMProcessor, read_text_cached
+from article_processor_function.grouping_service import ArticleGroup, GroupingService
 
 
 class TestLLMProcessorInit:
@@ -91,6 +92,26 @@ class TestLoadPromptTemplate:
         assert "article" in prompt.lower() or "ARTICLE" in prompt
 
 
+class TestReadTextCached:
+    """Tests for read_text_cached helper."""
+
+    def test_reuses_content_until_mtime_changes(self, tmp_path):
+        """Should return the cached text while the file's mtime is unchanged."""
+        prompt_file = tmp_path / "prompt.md"
+        prompt_file.write_text("first", encoding="utf-8")
+        first_stat = prompt_file.stat()
+
+        assert read_text_cached(prompt_file) == "first"
+
+        # Same mtime: cached text wins even though the bytes changed
+        prompt_file.write_text("other", encoding="utf-8")
+        os.utime(prompt_file, ns=(first_stat.st_atime_ns, first_stat.st_mtime_ns))
+        assert read_text_cached(prompt_file) == "first"
+
+        os.utime(prompt_file, ns=(first_stat.st_atime_ns, first_stat.st_mtime_ns + 1_000_000))
+        assert read_text_cached(prompt_file) == "other"
+
+
 class TestCreateBatchRequest:
     """Tests for create_batch_request method."""
 
@@ -537,4 +558,104 @@ class TestLLMProcessorModelConfig:
             storage_client=Mock(),
             bucket_name="test-bucket"
         )
-        assert "gemini" in processor.model
\ No newline at end of file
+        assert "gemini" in processor.model
+
+class TestWriteBatchJsonl:
+    """Tests for write_batch_jsonl method."""
+
+    def test_uploads_jsonl_from_memory(self):
+        """Should upload newline-delimited requests in a single call."""
+        mock_storage = Mock()
+        mock_blob = mock_storage.bucket.return_value.blob.return_value
+        processor = LLMProcessor(
+            genai_client=Mock(),
+            storage_client=mock_storage,
+            bucket_name="test-bucket"
+        )
+
+        uri = processor.write_batch_jsonl(
+            [{"request": {"id": 1}}, {"request": {"text": "Galatasaray ş"}}],
+            "batch/requests.jsonl"
+        )
+
+        assert uri == "gs://test-bucket/batch/requests.jsonl"
+        mock_blob.upload_from_string.assert_called_once()
+        content = mock_blob.upload_from_string.call_args[0][0]
+        lines = content.split('\n')
+        assert lines[-1] == ''
+        assert [json.loads(line) for line in lines[:-1]] == [
+            {"request": {"id": 1}},
+            {"request": {"text": "Galatasaray ş"}},
+        ]
+        assert "ş" in content
+        mock_blob.upload_from_filename.assert_not_called()
+
+
+class TestParseBatchResults:
+    """Tests for parse_batch_results method."""
+
+    def _prediction(self, response: dict) -> str:
+        return json.dumps({
+            "response": {"candidates": [{"content": {"parts": [{"text": json.dumps(response)}]}}]}
+        })
+
+    def test_parses_articles_from_bytes(self):
+        """Should parse every prediction line, skipping blank and bad lines."""
+        mock_storage = Mock()
+        mock_blob = mock_storage.bucket.return_value.blob.return_value
+        mock_blob.download_as_bytes.return_value = "\n".join([
+            self._prediction({"output_articles": [{"title": "Fenerbahçe"}]}),
+            "",
+            "not json",
+            self._prediction({"output_articles": [{"title": "B"}, {"title": "C"}]}),
+        ]).encode()
+        processor = LLMProcessor(
+            genai_client=Mock(),
+            storage_client=mock_storage,
+            bucket_name="test-bucket"
+        )
+
+        articles = processor.parse_batch_results("gs://test-bucket/out/predictions.jsonl", [])
+
+        assert [a["title"] for a in articles] == ["Fenerbahçe", "B", "C"]
+        mock_storage.bucket.assert_called_with("test-bucket")
+        mock_storage.bucket.return_value.blob.assert_called_with("out/predictions.jsonl")
+
+
+class TestDumpsPretty:
+    """Tests for dumps_pretty helper."""
+
+    def test_matches_stdlib_indented_output(self):
+        """Should produce the same prompt text as json.dumps(indent=2)."""
+        from article_processor_function.llm_processor import dumps_pretty
+
+        data = {
+            "group_id": 3,
+            "max_similarity": 0.87,
+            "articles": [{"title": "Beşiktaş \"derbi\"\nözeti", "tags": [], "meta": {}, "x": None}],
+        }
+
+        assert dumps_pretty(data) == json.dumps(data, ensure_ascii=False, indent=2)
+
+    def test_batch_request_with_grouped_articles(self):
+        """Should serialize groups built by GroupingService (numpy similarities)."""
+        import numpy as np
+
+        embeddings = np.array([[1.0, 0.0], [0.99, 0.1], [0.0, 1.0]])
+        groups = GroupingService(0.8).group_articles(embeddings)
+        articles = [{"article_id": f"a{i}", "title": f"Article {i}"} for i in range(3)]
+        processor = LLMProcessor(
+            genai_client=Mock(),
+            storage_client=Mock(),
+            bucket_name="test-bucket"
+        )
+
+        requests = processor.create_batch_request(
+            groups=[g for g in groups if not g.is_singleton],
+            articles=articles,
+            prompt_template="Test prompt"
+        )
+
+        data_text = requests[0]["request"]["contents"][0]["parts"][1]["text"]
+        group_input = json.loads(data_text.split("```json\n", 1)[1].rsplit("\n```", 1)[0])
+        assert group_input["max_similarity"] == pytest.approx(0.995, abs=0.01)
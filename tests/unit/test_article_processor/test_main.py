@@ -38,7 +38,9 @@ with patch.dict('os.environ', {'ENVIRONMENT': 'local'}):
         GROUPING_THRESHOLD,
         CROSS_RUN_DEDUP_THRESHOLD_TR,
         CROSS_RUN_DEDUP_THRESHOLD_EU,
+        get_processor,
     )
+    import article_processor_function.main as processor_main
 
 
 class TestExtractSourceType:
@@ -400,3 +402,35 @@ class TestTriggerPatternsStructure:
     def test_patterns_are_unique(self):
         """Test all patterns are unique."""
         assert len(set(TRIGGER_PATTERNS)) == len(TRIGGER_PATTERNS)
+
+
+class TestGetProcessor:
+    """Tests for get_processor shared instance."""
+
+    @pytest.fixture(autouse=True)
+    def reset_processor(self):
+        processor_main._processor = None
+        yield
+        processor_main._processor = None
+
+    def test_reuses_instance(self):
+        """Test the processor is built once per warm instance."""
+        with patch.object(processor_main, 'ArticleProcessor') as mock_cls:
+            mock_cls.return_value.genai_client = MagicMock()
+            with patch.object(processor_main, 'ENVIRONMENT', 'production'):
+                first = get_processor()
+                second = get_processor()
+
+        assert first is second
+        assert mock_cls.call_count == 1
+
+    def test_failed_client_not_cached(self):
+        """Test a processor without a Vertex AI client is rebuilt next time."""
+        with patch.object(processor_main, 'ArticleProcessor') as mock_cls:
+            mock_cls.return_value.genai_client = None
+            with patch.object(processor_main, 'ENVIRONMENT', 'production'):
+                get_processor()
+                get_processor()
+
+        assert mock_cls.call_count == 2
+        assert processor_main._processor is None
@@ -43,13 +43,33 @@ sys.modules['google.auth.transport.requests'] = MagicMock()
 with patch.dict('os.environ', {'ENVIRONMENT': 'local'}):
     from gcs_api_function.main import (
         hash_email,
+        download_json_if_exists,
+        get_user_preferences_path,
         get_date_range,
         get_cache_key,
+        get_cached_articles,
+        set_cached_articles,
+        get_article_cache_ttl,
+        CACHE,
         cors_headers,
+        json_response,
         normalize_article,
         deduplicate_articles,
+        load_blob_json,
+        load_blobs_json,
+        project_article_bodies,
+        BLOB_JSON_CACHE,
+        BLOB_JSON_CACHE_MAX_BYTES,
+        BLOB_JSON_CACHE_MAX_ENTRIES,
         CACHE_TTL_SECONDS,
         CONFIG_CACHE_TTL_SECONDS,
+        ARTICLE_CACHE_MAX_DATES,
+        ROUTES,
+        DIFF_RESPONSE_CACHE,
+        get_diff_response_key,
+        handle_get_diff,
+        handle_get_articles,
+        handle_put_preferences,
     )
 
 
@@ -186,6 +206,15 @@ class TestNormalizeArticle:
         assert result['source_type'] == 'scraped'
         assert result['keywords_used'] == []
 
+    def test_interns_low_cardinality_fields(self):
+        """Test repeated source/region strings share one object across articles."""
+        first = normalize_article({'source': ''.join(['fanatik', '.com.tr']), 'region': 'tr'})
+        second = normalize_article({'source': ''.join(['fanatik', '.com', '.tr']), 'region': 'tr'})
+
+        assert first['source'] is second['source']
+        assert first['region'] is second['region']
+        assert first['language'] is None
+
     def test_body_to_content(self):
         """Test body field is mapped to content."""
         article = {
@@ -671,3 +700,363 @@ class TestNormalizeArticleOptionalFields:
         article = {'article_id': 'test', 'key_entities': entities}
         result = normalize_article(article)
         assert result['key_entities'] == entities
+
+
+class TestLoadBlobJson:
+    """Tests for load_blob_json parsed-blob cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        BLOB_JSON_CACHE.clear()
+        yield
+        BLOB_JSON_CACHE.clear()
+
+    def _blob(self, name, generation, payload, size=None):
+        blob = MagicMock()
+        blob.name = name
+        blob.generation = generation
+        blob.download_as_bytes.return_value = json.dumps(payload).encode('utf-8')
+        blob.size = len(blob.download_as_bytes.return_value) if size is None else size
+        return blob
+
+    def test_parses_blob_content(self):
+        """Test blob JSON is parsed."""
+        blob = self._blob('a.json', 1, {'articles': [1, 2]})
+        assert load_blob_json(blob) == {'articles': [1, 2]}
+
+    def test_same_generation_served_from_cache(self):
+        """Test unchanged blob is not downloaded twice."""
+        blob = self._blob('a.json', 1, {'x': 1})
+        load_blob_json(blob)
+        load_blob_json(blob)
+        assert blob.download_as_bytes.call_count == 1
+
+    def test_new_generation_reloads(self):
+        """Test overwritten blob (new generation) is downloaded again."""
+        load_blob_json(self._blob('a.json', 1, {'x': 1}))
+        assert load_blob_json(self._blob('a.json', 2, {'x': 2})) == {'x': 2}
+
+    def test_blob_without_generation_not_cached(self):
+        """Test blobs without generation metadata bypass the cache."""
+        blob = self._blob('a.json', None, {'x': 1})
+        load_blob_json(blob)
+        load_blob_json(blob)
+        assert blob.download_as_bytes.call_count == 2
+        assert len(BLOB_JSON_CACHE) == 0
+
+    def test_projection_result_is_cached(self):
+        """Test only the projected data is cached, under its own key."""
+        blob = self._blob('a.json', 1, {'articles': [{'article_id': 'x', 'body': 'b', 'title': 't'}]})
+        assert load_blob_json(blob, project_article_bodies) == [('x', 'b')]
+        assert load_blob_json(blob, project_article_bodies) == [('x', 'b')]
+        assert blob.download_as_bytes.call_count == 1
+        assert [data for data, _ in BLOB_JSON_CACHE.values()] == [[('x', 'b')]]
+
+    def test_evicts_least_recently_used(self):
+        """Test cache is bounded."""
+        for i in range(BLOB_JSON_CACHE_MAX_ENTRIES + 1):
+            load_blob_json(self._blob(f'{i}.json', 1, {'i': i}))
+        assert len(BLOB_JSON_CACHE) == BLOB_JSON_CACHE_MAX_ENTRIES
+        assert ('0.json', 1) not in BLOB_JSON_CACHE
+
+    def test_evicts_beyond_byte_budget(self):
+        """Test cache is bounded by total blob size, oldest entries first."""
+        half = BLOB_JSON_CACHE_MAX_BYTES // 2
+        for i in range(3):
+            load_blob_json(self._blob(f'{i}.json', 1, {'i': i}, size=half))
+        assert list(BLOB_JSON_CACHE) == [('1.json', 1), ('2.json', 1)]
+
+    def test_oversized_blob_not_cached(self):
+        """Test a blob larger than the whole byte budget bypasses the cache."""
+        blob = self._blob('big.json', 1, {'x': 1}, size=BLOB_JSON_CACHE_MAX_BYTES + 1)
+        assert load_blob_json(blob) == {'x': 1}
+        assert len(BLOB_JSON_CACHE) == 0
+
+
+class TestLoadBlobsJson:
+    """Tests for load_blobs_json concurrent downloads."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        BLOB_JSON_CACHE.clear()
+        yield
+        BLOB_JSON_CACHE.clear()
+
+    def _blob(self, name, content):
+        blob = MagicMock()
+        blob.name = name
+        blob.generation = None
+        blob.download_as_bytes.return_value = content.encode('utf-8')
+        return blob
+
+    def test_preserves_input_order(self):
+        """Test results come back in the order of the input blobs."""
+        blobs = [self._blob(f'{i}.json', json.dumps({'i': i})) for i in range(20)]
+        results = load_blobs_json(blobs)
+        assert [data['i'] for _, data in results] == list(range(20))
+        assert [blob for blob, _ in results] == blobs
+
+    def test_skips_failed_blobs(self):
+        """Test unparseable blobs are dropped, others still returned."""
+        blobs = [
+            self._blob('good.json', '{"ok": true}'),
+            self._blob('bad.json', 'not json'),
+        ]
+        results = load_blobs_json(blobs)
+        assert [blob.name for blob, _ in results] == ['good.json']
+
+    def test_empty_list(self):
+        """Test no blobs returns empty list."""
+        assert load_blobs_json([]) == []
+
+
+class TestProjectArticleBodies:
+    """Tests for project_article_bodies."""
+
+    def test_keeps_id_and_body_only(self):
+        """Test articles are reduced to (article_id, body) pairs."""
+        data = {'articles': [
+            {'article_id': 'a', 'body': 'text', 'title': 'T'},
+            {'article_id': 'b', 'content': 'fallback'},
+            {'article_id': 'c', 'body': ''},
+            {'body': 'no id'},
+        ]}
+        assert project_article_bodies(data) == [('a', 'text'), ('b', 'fallback')]
+
+    def test_missing_articles(self):
+        """Test file without articles yields no pairs."""
+        assert project_article_bodies({}) == []
+
+
+class TestJsonResponse:
+    """Tests for json_response."""
+
+    def test_body_round_trips_with_cors_headers(self):
+        """Test body decodes to the input and keeps non-ASCII text as UTF-8."""
+        body, status, headers = json_response({'title': 'Beşiktaş', 'n': [1, 2]}, 201)
+
+        raw = body.encode('utf-8') if isinstance(body, str) else body
+        assert json.loads(raw) == {'title': 'Beşiktaş', 'n': [1, 2]}
+        assert 'Beşiktaş'.encode('utf-8') in raw
+        assert status == 201
+        assert headers['Content-Type'] == 'application/json'
+
+    def test_stdlib_fallback(self):
+        """Test stdlib encoding is used without orjson."""
+        with patch('gcs_api_function.main.ORJSON_AVAILABLE', False):
+            body, status, _ = json_response({'error': 'x'}, 400)
+
+        assert body == '{"error": "x"}'
+        assert status == 400
+
+
+class TestGetUserPreferencesPath:
+    """Tests for get_user_preferences_path."""
+
+    def test_path_uses_email_hash(self):
+        """Test path is built from the hashed email."""
+        path = get_user_preferences_path('User@Example.com')
+        assert path == f"config/user_preferences/{hash_email('user@example.com')}/preferences.json"
+
+    def test_result_is_memoized(self):
+        """Test repeated lookups hit the cache."""
+        get_user_preferences_path.cache_clear()
+        get_user_preferences_path('a@example.com')
+        get_user_preferences_path('a@example.com')
+        info = get_user_preferences_path.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+
+class TestDownloadJsonIfExists:
+    """Tests for download_json_if_exists."""
+
+    class _NotFound(Exception):
+        code = 404
+
+    def test_returns_parsed_content(self):
+        """Test existing blob is parsed without an exists() call."""
+        blob = MagicMock()
+        blob.download_as_bytes.return_value = b'{"allowed_users": ["a@b.com"]}'
+        assert download_json_if_exists(blob) == {'allowed_users': ['a@b.com']}
+        blob.exists.assert_not_called()
+
+    def test_missing_blob_returns_none(self):
+        """Test 404 is treated as missing."""
+        blob = MagicMock()
+        blob.download_as_bytes.side_effect = self._NotFound()
+        assert download_json_if_exists(blob) is None
+
+    def test_other_errors_propagate(self):
+        """Test non-404 errors are raised."""
+        blob = MagicMock()
+        blob.download_as_bytes.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            download_json_if_exists(blob)
+
+
+class TestArticleCacheTtl:
+    """Tests for get_cached_articles/set_cached_articles TTL handling."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        CACHE.clear()
+        yield
+        CACHE.clear()
+
+    def test_fresh_entry_returned(self):
+        """Test entry within TTL is served."""
+        set_cached_articles('2025-01-01', [{'article_id': 'a'}])
+        assert get_cached_articles('2025-01-01') == [{'article_id': 'a'}]
+
+    def test_expired_entry_evicted_with_passed_clock(self):
+        """Test a caller-supplied clock reading is used for expiry."""
+        set_cached_articles('2025-01-01', [{'article_id': 'a'}])
+        later = CACHE[get_cache_key('2025-01-01')]['timestamp'] + CACHE_TTL_SECONDS + 1
+        assert get_cached_articles('2025-01-01', later) is None
+        assert get_cache_key('2025-01-01') not in CACHE
+
+    def test_missing_entry(self):
+        """Test unknown date returns None."""
+        assert get_cached_articles('1999-01-01') is None
+
+    def test_entry_ttl_overrides_default(self):
+        """Test a per-entry TTL outlives the default TTL."""
+        set_cached_articles('2025-01-01', [{'article_id': 'a'}], ttl_seconds=CACHE_TTL_SECONDS * 6)
+        later = CACHE[get_cache_key('2025-01-01')]['timestamp'] + CACHE_TTL_SECONDS + 1
+        assert get_cached_articles('2025-01-01', later) == [{'article_id': 'a'}]
+
+    def test_oldest_dates_evicted_beyond_limit(self):
+        """Test the article cache holds at most ARTICLE_CACHE_MAX_DATES dates."""
+        CACHE['api_key'] = {'data': 'k', 'timestamp': 0}
+        for day in range(ARTICLE_CACHE_MAX_DATES + 2):
+            set_cached_articles(f'2025-01-{day + 1:02d}', [])
+
+        assert get_cache_key('2025-01-01') not in CACHE
+        assert get_cache_key('2025-01-02') not in CACHE
+        assert get_cache_key(f'2025-01-{ARTICLE_CACHE_MAX_DATES + 2:02d}') in CACHE
+        assert 'api_key' in CACHE
+
+    def test_read_refreshes_recency(self):
+        """Test a date that is read again outlives dates written after it."""
+        for day in range(ARTICLE_CACHE_MAX_DATES):
+            set_cached_articles(f'2025-01-{day + 1:02d}', [])
+        get_cached_articles('2025-01-01')
+        set_cached_articles('2025-02-01', [])
+
+        assert get_cache_key('2025-01-01') in CACHE
+        assert get_cache_key('2025-01-02') not in CACHE
+
+    def test_expired_dates_evicted_first(self):
+        """Test expired dates are dropped before fresh ones."""
+        set_cached_articles('2025-01-01', [])
+        set_cached_articles('2025-01-02', [])
+        CACHE[get_cache_key('2025-01-02')]['timestamp'] -= CACHE_TTL_SECONDS + 1
+        set_cached_articles('2025-01-03', [])
+
+        assert get_cache_key('2025-01-01') in CACHE
+        assert get_cache_key('2025-01-02') not in CACHE
+
+    def test_protected_keys_not_evicted(self):
+        """Test a request spanning more dates than the limit keeps all of them."""
+        dates = [f'2025-{month:02d}-01' for month in range(1, 13)] + \
+                [f'2025-01-{day:02d}' for day in range(2, ARTICLE_CACHE_MAX_DATES + 1)]
+        request_keys = {get_cache_key(date) for date in dates}
+        for date in dates:
+            set_cached_articles(date, [], protected_keys=request_keys)
+
+        assert all(key in CACHE for key in request_keys)
+
+        set_cached_articles('2026-01-01', [])
+        assert sum(1 for key in CACHE if key.startswith('articles_')) == ARTICLE_CACHE_MAX_DATES
+
+    def test_past_dates_get_longer_ttl(self):
+        """Test only today's articles use the short TTL."""
+        assert get_article_cache_ttl('2025-01-02', '2025-01-02') == CACHE_TTL_SECONDS
+        assert get_article_cache_ttl('2025-01-01', '2025-01-02') > CACHE_TTL_SECONDS
+
+
+class TestRoutes:
+    """Tests for the ROUTES dispatch table."""
+
+    def test_root_and_articles_share_handler(self):
+        """Test '/' (stripped to '') and '/articles' both serve articles."""
+        assert ROUTES[('', 'GET')] is handle_get_articles
+        assert ROUTES[('/articles', 'GET')] is handle_get_articles
+
+    def test_method_is_part_of_key(self):
+        """Test the same path dispatches per method, unknown methods miss."""
+        assert ROUTES[('/user/preferences', 'PUT')] is handle_put_preferences
+        assert ('/articles', 'POST') not in ROUTES
+
+
+class TestDiffResponseCache:
+    """Tests for caching built diff responses."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        DIFF_RESPONSE_CACHE.clear()
+        BLOB_JSON_CACHE.clear()
+        yield
+        DIFF_RESPONSE_CACHE.clear()
+        BLOB_JSON_CACHE.clear()
+
+    def _blob(self, name, generation, payload):
+        blob = MagicMock()
+        blob.name = name
+        blob.generation = generation
+        blob.download_as_bytes.return_value = json.dumps(payload).encode('utf-8')
+        return blob
+
+    def test_key_requires_generations(self):
+        """Test blobs without generation metadata disable caching."""
+        assert get_diff_response_key([self._blob('a.json', 1, {})]) == (('a.json', 1),)
+        assert get_diff_response_key([self._blob('a.json', None, {})]) is None
+
+    def test_unchanged_files_reuse_response(self):
+        """Test a repeated request with the same files skips rebuilding."""
+        name = 'ingestion/2025-01-01/08-00-00/analysis/region_diff_eu_vs_tr.json'
+        blob = self._blob(name, 1, {'unique_articles': [{'article_id': 'a', 'title': 'T'}]})
+        request = MagicMock()
+        request.args.get.side_effect = lambda key, default=None, type=None: (
+            '2025-01-01' if key in ('startDate', 'endDate') else default
+        )
+
+        with patch('gcs_api_function.main.validate_api_key', return_value=True), \
+                patch('gcs_api_function.main.storage_client') as mock_client, \
+                patch('gcs_api_function.main.json_response', side_effect=lambda data: data), \
+                patch('gcs_api_function.main.normalize_article', wraps=normalize_article) as normalize:
+            mock_client.bucket.return_value.list_blobs.return_value = [blob]
+            first = handle_get_diff(request)
+            second = handle_get_diff(request)
+
+        assert [e['article_id'] for e in first] == ['a']
+        assert first[0]['region'] == 'diff'
+        assert second is first
+        assert normalize.call_count == 1
+
+    def test_partial_load_not_cached(self):
+        """Test a response missing a failed download is rebuilt once GCS recovers."""
+        prefix = 'ingestion/2025-01-01/08-00-00/analysis/'
+        good = self._blob(f'{prefix}region_diff_eu_vs_tr.json', 1,
+                          {'unique_articles': [{'article_id': 'a'}]})
+        flaky = self._blob(f'{prefix}region_diff_eu_vs_us.json', 1,
+                           {'unique_articles': [{'article_id': 'b'}]})
+        flaky.download_as_bytes.side_effect = [RuntimeError("transient"),
+                                               json.dumps({'unique_articles': [{'article_id': 'b'}]}).encode('utf-8')]
+        request = MagicMock()
+        request.args.get.side_effect = lambda key, default=None, type=None: (
+            '2025-01-01' if key in ('startDate', 'endDate') else default
+        )
+
+        with patch('gcs_api_function.main.validate_api_key', return_value=True), \
+                patch('gcs_api_function.main.storage_client') as mock_client, \
+                patch('gcs_api_function.main.json_response', side_effect=lambda data: data):
+            mock_client.bucket.return_value.list_blobs.return_value = [good, flaky]
+            first = handle_get_diff(request)
+            assert len(DIFF_RESPONSE_CACHE) == 0
+            second = handle_get_diff(request)
+
+        assert [e['article_id'] for e in first] == ['a']
+        assert [e['article_id'] for e in second] == ['a', 'b']
+        assert len(DIFF_RESPONSE_CACHE) == 1
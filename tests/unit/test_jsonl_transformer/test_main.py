@@ -18,6 +18,9 @@ with patch.dict('os.environ', {'ENVIRONMENT': 'local'}):
         transform_enrichment_results,
         transform_merge_results,
         apply_merge_decisions,
+        upload_json,
+        download_jsonl,
+        load_original_articles,
         LANGUAGE_MAP,
     )
 
@@ -1256,6 +1259,28 @@ class TestTransformEnrichmentResultsMetadata:
         assert "enriched_at" in metadata
         assert metadata["enrichment_processor"] == "batch_enrichment"
 
+    def test_enriched_at_shared_across_batch(self):
+        """Test all articles in one batch get the same enriched_at stamp."""
+        entries = [{
+            "response": {
+                "candidates": [{
+                    "content": {
+                        "parts": [{"text": json.dumps({
+                            "enriched_articles": [
+                                {"article_id": f"a{i}"} for i in range(5)
+                            ]
+                        })}]
+                    }
+                }]
+            }
+        }]
+
+        result = transform_enrichment_results(entries)
+
+        stamps = {a["_processing_metadata"]["enriched_at"] for a in result}
+        assert len(result) == 5
+        assert len(stamps) == 1
+
     def test_body_from_original_preserved(self):
         """Test body is preserved from original articles."""
         entries = [{
@@ -1281,3 +1306,92 @@ class TestTransformEnrichmentResultsMetadata:
         result = transform_enrichment_results(entries, original_articles)
         
         assert result[0]["body"] == "Original full article body content..."
+
+
+class TestUploadJson:
+    """Tests for upload_json serialization format."""
+
+    def test_compact_by_default(self):
+        """Test article payloads are uploaded without indentation."""
+        with patch('jsonl_transformer_function.main.storage_client') as mock_client:
+            mock_blob = mock_client.bucket.return_value.blob.return_value
+            upload_json({'articles': [{'title': 'Fenerbahçe'}]}, 'out.json')
+
+        content = mock_blob.upload_from_string.call_args[0][0]
+        assert '\n' not in content
+        assert 'Fenerbahçe' in content
+        assert json.loads(content) == {'articles': [{'title': 'Fenerbahçe'}]}
+
+    def test_pretty_when_requested(self):
+        """Test pretty=True keeps indented output."""
+        with patch('jsonl_transformer_function.main.storage_client') as mock_client:
+            mock_blob = mock_client.bucket.return_value.blob.return_value
+            upload_json({'status': 'ok'}, 'meta.json', pretty=True)
+
+        content = mock_blob.upload_from_string.call_args[0][0]
+        assert content == json.dumps({'status': 'ok'}, indent=2)
+
+
+class TestDownloadJsonl:
+    """Tests for download_jsonl parsing."""
+
+    def test_parses_lines_from_bytes(self):
+        """Test JSONL bytes are parsed line by line, skipping blanks."""
+        raw = '{"a": 1}\n\n{"b": "Beşiktaş"}\r\n'.encode('utf-8')
+        with patch('jsonl_transformer_function.main.storage_client') as mock_client:
+            mock_client.bucket.return_value.blob.return_value.download_as_bytes.return_value = raw
+            result = download_jsonl('path/predictions.jsonl')
+
+        assert result == [{'a': 1}, {'b': 'Beşiktaş'}]
+
+    def test_stdlib_fallback(self):
+        """Test parsing works without orjson."""
+        with patch('jsonl_transformer_function.main.storage_client') as mock_client, \
+                patch('jsonl_transformer_function.main.ORJSON_AVAILABLE', False):
+            mock_client.bucket.return_value.blob.return_value.download_as_bytes.return_value = b'{"a": 1}\n'
+            result = download_jsonl('path/predictions.jsonl')
+
+        assert result == [{'a': 1}]
+
+    def test_invalid_line_raises(self):
+        """Test malformed JSON propagates to caller."""
+        with patch('jsonl_transformer_function.main.storage_client') as mock_client:
+            mock_client.bucket.return_value.blob.return_value.download_as_bytes.return_value = b'not json\n'
+            with pytest.raises(ValueError):
+                download_jsonl('path/predictions.jsonl')
+
+
+class TestLoadOriginalArticles:
+    """Tests for load_original_articles function."""
+
+    @staticmethod
+    def _blob(name, articles):
+        blob = MagicMock()
+        blob.name = name
+        blob.download_as_bytes.return_value = json.dumps({'articles': articles}).encode('utf-8')
+        return blob
+
+    def test_loads_articles_with_body_in_file_order(self):
+        """Test later files override earlier ones and articles without body are skipped."""
+        merged = [
+            self._blob('run/merged/input/a.json', [{'article_id': 'x', 'body': 'first'}]),
+            self._blob('run/merged/input/b.json', [{'article_id': 'x', 'body': 'second'},
+                                                   {'article_id': 'y', 'body': ''}]),
+        ]
+        with patch('jsonl_transformer_function.main.storage_client') as mock_client:
+            mock_client.bucket.return_value.list_blobs.side_effect = [merged, []]
+            result = load_original_articles('run', 'complete')
+
+        assert result == {'x': {'article_id': 'x', 'body': 'second'}}
+
+    def test_skips_unreadable_blob(self):
+        """Test a failing download does not abort the remaining files."""
+        bad = MagicMock()
+        bad.name = 'run/singleton/input/bad.json'
+        bad.download_as_bytes.side_effect = Exception('boom')
+        good = self._blob('run/singleton/input/good.json', [{'article_id': 'z', 'body': 'text'}])
+        with patch('jsonl_transformer_function.main.storage_client') as mock_client:
+            mock_client.bucket.return_value.list_blobs.side_effect = [[], [bad, good]]
+            result = load_original_articles('run', 'complete')
+
+        assert list(result) == ['z']
@@ -343,3 +343,22 @@ class TestMergeDeciderConstants:
         import os
         project = os.getenv('GOOGLE_CLOUD_PROJECT', 'gen-lang-client-0306766464')
         assert 'gen-lang' in project or project
+
+
+class TestUploadBatchRequest:
+    """Tests for MergeDecider.upload_batch_request."""
+
+    def test_jsonl_matches_json_dumps(self):
+        """Test shared encoder output is identical to json.dumps per line."""
+        import json
+        from merge_decider_function.main import MergeDecider
+
+        decider = MergeDecider()
+        decider.storage_client = MagicMock()
+        mock_blob = decider.storage_client.bucket.return_value.blob.return_value
+        requests = [{"request": {"text": "Fenerbahçe"}}, {"request": {"n": 1}}]
+
+        decider.upload_batch_request(requests, "ingestion/2025-01-01/10-00-00", "complete")
+
+        content = mock_blob.upload_from_string.call_args[0][0]
+        assert content == '\n'.join(json.dumps(r, ensure_ascii=False) for r in requests)
@@ -460,3 +460,119 @@ class TestDefaultKeywordsDetails:
     def test_no_duplicate_keywords(self):
         """Test no duplicate keywords."""
         assert len(DEFAULT_KEYWORDS) == len(set(DEFAULT_KEYWORDS))
+
+
+class TestIterArticleUrls:
+    """Tests for iter_article_urls streaming URL extraction."""
+
+    def _blob(self, data):
+        import io
+        import json
+
+        raw = json.dumps(data).encode('utf-8')
+        blob = MagicMock()
+        blob.open.side_effect = lambda mode: io.BytesIO(raw)
+        blob.download_as_string.return_value = raw
+        return blob
+
+    def test_prefers_original_url(self):
+        """Test original_url wins over url, and url is used as fallback."""
+        from news_api_fetcher_function.main import iter_article_urls
+
+        blob = self._blob({'articles': [
+            {'url': 'https://a.com/1', 'original_url': 'https://orig.com/1', 'body': 'x' * 100},
+            {'url': 'https://b.com/2', 'title': 'T', 'source': {'url': 'https://nested.com'}},
+            {'title': 'no url'},
+        ]})
+
+        assert list(iter_article_urls(blob)) == ['https://orig.com/1', 'https://b.com/2']
+
+    def test_fallback_without_ijson(self):
+        """Test full-parse fallback yields the same URLs."""
+        from news_api_fetcher_function import main as fetcher_main
+
+        blob = self._blob({'articles': [
+            {'url': 'https://a.com/1', 'original_url': 'https://orig.com/1'},
+            {'url': 'https://b.com/2'},
+        ]})
+
+        with patch.object(fetcher_main, 'IJSON_AVAILABLE', False):
+            urls = list(fetcher_main.iter_article_urls(blob))
+
+        assert urls == ['https://orig.com/1', 'https://b.com/2']
+        blob.open.assert_not_called()
+
+    def test_missing_articles_key(self):
+        """Test files without articles yield nothing."""
+        from news_api_fetcher_function.main import iter_article_urls
+
+        assert list(iter_article_urls(self._blob({'count': 0}))) == []
+
+
+class TestFetchAndStoreNews:
+    """Tests for fetch_and_store_news deduplication flow."""
+
+    def _run(self, fetched, existing):
+        import asyncio
+        from news_api_fetcher_function import main as fetcher_main
+
+        async def get_news(keywords=None):
+            return fetched
+
+        aggregator = MagicMock()
+        aggregator.get_news.side_effect = get_news
+        api_keys = {'newsapi_key': 'k', 'worldnewsapi_key': None, 'gnews_api_key': None}
+
+        with patch.object(fetcher_main, 'CET', timezone.utc), \
+             patch.object(fetcher_main, 'get_api_keys', return_value=api_keys), \
+             patch.object(fetcher_main, 'NewsAggregator', return_value=aggregator), \
+             patch.object(fetcher_main, 'get_existing_articles_for_date', return_value=existing) as get_existing:
+            result = asyncio.run(fetcher_main.fetch_and_store_news({'keywords': ['galatasaray']}))
+        return result, get_existing
+
+    def test_existing_urls_filter_fetched_articles(self):
+        """Test URLs loaded alongside the fetch are used for deduplication."""
+        result, get_existing = self._run(
+            [{'url': 'https://a.com/1'}], {'https://a.com/1'}
+        )
+
+        get_existing.assert_called_once()
+        assert result['articles_count'] == 0
+        assert result['duplicates_filtered'] == 1
+
+    def test_no_articles_returns_success(self):
+        """Test empty fetch returns without waiting on the existing-URL load."""
+        result, _ = self._run([], set())
+
+        assert result == {'status': 'success', 'articles_count': 0, 'triggered_by': 'scheduler'}
+
+
+class TestUploadRawResponses:
+    """Tests for upload_raw_responses."""
+
+    def test_uploads_each_response(self):
+        """Test every API response is written under responses/."""
+        import asyncio
+        from news_api_fetcher_function import main as fetcher_main
+
+        with patch.object(fetcher_main, 'upload_to_gcs') as upload:
+            asyncio.run(fetcher_main.upload_raw_responses(
+                'bucket', 'ingestion/2025-01-01/10-00-00',
+                {'newsapi': {'a': 1}, 'gnews': {'b': 2}}
+            ))
+
+        calls = sorted(c.args for c in upload.call_args_list)
+        assert calls == [
+            ('bucket', 'ingestion/2025-01-01/10-00-00/responses/gnews.json', {'b': 2}),
+            ('bucket', 'ingestion/2025-01-01/10-00-00/responses/newsapi.json', {'a': 1}),
+        ]
+
+    def test_empty_responses(self):
+        """Test nothing is uploaded when no responses were stored."""
+        import asyncio
+        from news_api_fetcher_function import main as fetcher_main
+
+        with patch.object(fetcher_main, 'upload_to_gcs') as upload:
+            asyncio.run(fetcher_main.upload_raw_responses('bucket', 'base', {}))
+
+        upload.assert_not_called()
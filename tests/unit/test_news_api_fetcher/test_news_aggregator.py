@@ -11,6 +11,7 @@ sys.modules['aiohttp'] = mock_aiohttp
 
 from news_api_fetcher_function.news_aggregator import (
     is_content_complete,
+    source_name_for_domain,
     TimeRangeEnum,
     NewsAggregator,
 )
@@ -324,6 +325,17 @@ class TestNewsAggregatorExtractDomain:
         # Should return first part of domain
         assert domain is not None
 
+    def test_extract_domain_memoized_per_netloc(self):
+        """Test articles from the same domain reuse the cached source name."""
+        source_name_for_domain.cache_clear()
+        aggregator = NewsAggregator()
+
+        first = aggregator._extract_domain("https://www.fanatik.com.tr/a")
+        second = aggregator._extract_domain("https://www.fanatik.com.tr/b")
+
+        assert first == second == "Fanatik"
+        assert source_name_for_domain.cache_info().hits == 1
+
 
 class TestNewsAggregatorGetDateRangeTimeRanges:
     """Tests for different time ranges in get_date_range."""
@@ -373,6 +385,17 @@ class TestNewsAggregatorGetDateRangeTimeRanges:
         diff = to_date - from_date
         assert diff.days >= 29 and diff.days <= 31
 
+    def test_get_date_range_custom_without_dates_defaults_to_24_hours(self):
+        """Test custom range without dates falls back to last 24 hours."""
+        aggregator = NewsAggregator()
+        aggregator.time_range = TimeRangeEnum.CUSTOM
+
+        date_range = aggregator.get_date_range()
+
+        from_date = datetime.strptime(date_range["from"], "%Y-%m-%d")
+        to_date = datetime.strptime(date_range["to"], "%Y-%m-%d")
+        assert (to_date - from_date).days == 1
+
 
 class TestNewsAggregatorConfigureMethods:
     """More tests for NewsAggregator configuration."""
@@ -461,3 +484,88 @@ class TestNewsAggregatorUpdateKeywordsEdgeCases:
         aggregator.update_keywords([["word1", "word2"]])
         
         assert aggregator.keywords == ["word1", "word2"]
+
+
+class TestNewsAggregatorSharedSession:
+    """Tests for the ClientSession shared across get_news fetches."""
+
+    def test_fetches_share_one_session(self):
+        """Test all source fetches run on the session opened by get_news."""
+        import asyncio
+
+        aggregator = NewsAggregator(newsapi_key="a", worldnewsapi_key="b", gnews_api_key="c")
+        seen_sessions = []
+
+        async def fake_fetch():
+            async with aggregator._client_session() as session:
+                seen_sessions.append(session)
+            return []
+
+        mock_aiohttp.ClientSession.reset_mock()
+        with patch.object(aggregator, 'fetch_newsapi_articles', side_effect=fake_fetch), \
+             patch.object(aggregator, 'fetch_worldnewsapi_articles', side_effect=fake_fetch), \
+             patch.object(aggregator, 'fetch_gnews_articles', side_effect=fake_fetch):
+            asyncio.run(aggregator.get_news(["galatasaray"]))
+
+        assert mock_aiohttp.ClientSession.call_count == 1
+        assert len(seen_sessions) == 3
+        assert all(s is seen_sessions[0] for s in seen_sessions)
+        assert aggregator._session is None
+
+
+class TestNewsAggregatorGetNews:
+    """Tests for NewsAggregator.get_news source fan-out."""
+
+    def test_failing_source_does_not_cancel_others(self):
+        """Test an error from one source is logged and other sources still return."""
+        import asyncio
+
+        aggregator = NewsAggregator(newsapi_key="a", worldnewsapi_key="b", gnews_api_key="c")
+
+        async def ok_newsapi():
+            return [{"url": "https://a.com/1", "publish_date": "2025-01-02"}]
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        async def ok_gnews():
+            await asyncio.sleep(0)
+            return [{"url": "https://b.com/2", "publish_date": "2025-01-01"}]
+
+        with patch.object(aggregator, 'fetch_newsapi_articles', side_effect=ok_newsapi), \
+             patch.object(aggregator, 'fetch_worldnewsapi_articles', side_effect=boom), \
+             patch.object(aggregator, 'fetch_gnews_articles', side_effect=ok_gnews):
+            result = asyncio.run(aggregator.get_news(["galatasaray"]))
+
+        assert [a["url"] for a in result] == ["https://a.com/1", "https://b.com/2"]
+
+    def test_no_sources_returns_empty(self):
+        """Test no configured API keys returns no articles."""
+        import asyncio
+
+        assert asyncio.run(NewsAggregator().get_news()) == []
+
+
+class TestNewsAggregatorDeduplicate:
+    """Tests for NewsAggregator.deduplicate_articles."""
+
+    def test_duplicate_urls_removed_in_order(self):
+        """Test first occurrence of each URL is kept."""
+        aggregator = NewsAggregator()
+        articles = [
+            {"url": "https://a.com/1", "title": "first"},
+            {"url": "https://b.com/2"},
+            {"url": "https://a.com/1", "title": "second"},
+        ]
+
+        result = aggregator.deduplicate_articles(articles)
+
+        assert [a["url"] for a in result] == ["https://a.com/1", "https://b.com/2"]
+        assert result[0]["title"] == "first"
+
+    def test_dedup_key_is_url(self):
+        """Test the dedup key is the article URL itself."""
+        aggregator = NewsAggregator()
+
+        assert aggregator._dedup_key({"url": "https://a.com/1"}) == "https://a.com/1"
+        assert aggregator._dedup_key({}) == ""
@@ -27,6 +27,7 @@ with patch.dict('os.environ', {'ENVIRONMENT': 'local'}):
         HISTORICAL_DIFF_DEPTH,
         GCS_BUCKET_NAME,
         PROJECT_ID,
+        get_analyzer,
     )
 
 
@@ -159,6 +160,22 @@ class TestMainModuleFunctions:
         assert output_path == expected
 
 
+class TestGetAnalyzer:
+    """Tests for get_analyzer reuse across event triggers."""
+
+    def test_reuses_analyzer_per_bucket(self):
+        """Test the same analyzer is returned for a bucket, configured from module settings."""
+        get_analyzer.cache_clear()
+        first = get_analyzer('bucket-a')
+
+        assert get_analyzer('bucket-a') is first
+        assert get_analyzer('bucket-b') is not first
+        assert first.bucket_name == 'bucket-a'
+        assert first.diff_threshold == REGION_DIFF_THRESHOLD
+        assert first.historical_diff_depth == HISTORICAL_DIFF_DEPTH
+        get_analyzer.cache_clear()
+
+
 class TestMainHTTPHandler:
     """Tests for HTTP handler in region_diff_function/main.py."""
 
@@ -484,3 +501,135 @@ class TestOutputPathGeneration:
         """Test output file is JSON."""
         output_path = "folder/analysis/region_diff_eu_vs_tr.json"
         assert output_path.endswith('.json')
+
+
+class TestLoadEmbeddingsFromGcs:
+    """Tests for RegionDiffAnalyzer.load_embeddings_from_gcs formats."""
+
+    def _analyzer_with_content(self, content):
+        from region_diff_function.region_diff import RegionDiffAnalyzer
+
+        mock_client = MagicMock()
+        blob = mock_client.bucket.return_value.blob.return_value
+        blob.download_as_text.return_value = content
+        return RegionDiffAnalyzer(mock_client, 'bucket')
+
+    def test_packed_embeddings(self):
+        """Test packed float32 column is decoded to (n, dim)."""
+        import base64
+        import json
+
+        matrix = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], dtype='<f4')
+        analyzer = self._analyzer_with_content(json.dumps({
+            'article_ids': ['a', 'b'],
+            'embedding_dim': 3,
+            'embeddings_b64': base64.b64encode(matrix.tobytes()).decode('ascii'),
+        }))
+
+        ids, embeddings = analyzer.load_embeddings_from_gcs('emb.json')
+
+        assert ids == ['a', 'b']
+        np.testing.assert_array_equal(embeddings, matrix)
+
+    def test_legacy_list_embeddings(self):
+        """Test legacy JSON list format is still supported."""
+        import json
+
+        analyzer = self._analyzer_with_content(json.dumps({
+            'article_ids': ['a'],
+            'embeddings': [[0.5, 0.5]],
+        }))
+
+        ids, embeddings = analyzer.load_embeddings_from_gcs('emb.json')
+
+        assert ids == ['a']
+        np.testing.assert_array_equal(embeddings, np.array([[0.5, 0.5]]))
+
+
+def _named_blobs(names):
+    """Build mock blobs as returned by list_blobs."""
+    blobs = []
+    for name in names:
+        blob = MagicMock()
+        blob.name = name
+        blobs.append(blob)
+    return blobs
+
+
+class TestLoadAllEmbeddingsFromRun:
+    """Tests for RegionDiffAnalyzer.load_all_embeddings_from_run."""
+
+    def test_stacks_files_in_order(self):
+        """Test per-file matrices are stacked in EMBEDDING_FILES order."""
+        from region_diff_function.region_diff import RegionDiffAnalyzer, EMBEDDING_FILES
+
+        run = 'ingestion/2025-12-22/08-37-29'
+        client = MagicMock()
+        client.bucket.return_value.list_blobs.return_value = _named_blobs(
+            f'{run}/{name}' for name in EMBEDDING_FILES
+        )
+        analyzer = RegionDiffAnalyzer(client, 'bucket')
+        per_file = [
+            (['a', 'b'], np.array([[1.0, 0.0], [0.0, 1.0]])),
+            ([], np.array([])),
+            (['c'], np.array([[0.5, 0.5]])),
+        ]
+
+        with patch.object(analyzer, 'load_embeddings_from_gcs', side_effect=per_file):
+            ids, embeddings = analyzer.load_all_embeddings_from_run(run)
+
+        assert ids == ['a', 'b', 'c']
+        np.testing.assert_array_equal(
+            embeddings, np.array([[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]])
+        )
+
+    def test_only_downloads_listed_files(self):
+        """Test files missing from the folder listing are not fetched."""
+        from region_diff_function.region_diff import RegionDiffAnalyzer, EMBEDDING_FILES
+
+        run = 'ingestion/2025-12-22/08-37-29'
+        client = MagicMock()
+        client.bucket.return_value.list_blobs.return_value = _named_blobs(
+            [f'{run}/{EMBEDDING_FILES[1]}']
+        )
+        analyzer = RegionDiffAnalyzer(client, 'bucket')
+
+        with patch.object(
+            analyzer, 'load_embeddings_from_gcs', return_value=(['a'], np.array([[1.0, 0.0]]))
+        ) as load:
+            ids, _ = analyzer.load_all_embeddings_from_run(run)
+
+        assert ids == ['a']
+        load.assert_called_once_with(f'{run}/{EMBEDDING_FILES[1]}')
+        client.bucket.return_value.list_blobs.assert_called_once_with(
+            prefix=f'{run}/embeddings/', delimiter='/'
+        )
+
+
+class TestLoadHistoricalTrData:
+    """Tests for RegionDiffAnalyzer.load_historical_tr_data."""
+
+    def test_indices_point_into_stacked_embeddings(self):
+        """Test each article's embedding index matches its row across run folders."""
+        from region_diff_function.region_diff import RegionDiffAnalyzer
+
+        analyzer = RegionDiffAnalyzer(MagicMock(), 'bucket', historical_diff_depth=1)
+        runs = {
+            'run1': (['t1', 'e1', 't2'], np.array([[1.0, 0.0], [9.0, 9.0], [0.0, 1.0]])),
+            'run2': (['t2', 't3'], np.array([[5.0, 5.0], [0.5, 0.5]])),
+        }
+        articles = {
+            'run1': [{'article_id': 't1', 'region': 'tr'}, {'article_id': 'e1', 'region': 'eu'},
+                     {'article_id': 't2', 'region': 'TR'}],
+            'run2': [{'article_id': 't2', 'region': 'tr'}, {'article_id': 't3', 'region': 'tr'}],
+        }
+
+        with patch.object(analyzer, 'find_run_folders_for_date', return_value=['run1', 'run2']), \
+             patch.object(analyzer, 'load_all_embeddings_from_run', side_effect=lambda r: runs[r]), \
+             patch.object(analyzer, 'load_all_articles_from_run', side_effect=lambda r: articles[r]):
+            data, embeddings = analyzer.load_historical_tr_data('ingestion/2025-12-22/08-37-29', 'tr')
+
+        assert [(aid, idx) for aid, idx, _ in data] == [('t1', 0), ('t2', 1), ('t3', 2)]
+        np.testing.assert_array_equal(
+            embeddings, np.array([[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]])
+        )
@@ -33,6 +33,7 @@ with patch.dict('os.environ', {'ENVIRONMENT': 'local'}):
         validate_scraping_request,
         apply_metadata_to_articles,
         normalize_publish_date,
+        iter_session_article_urls,
         VALID_REGIONS,
     )
 
@@ -296,6 +297,21 @@ class TestNormalizePublishDate:
         """Test whitespace-only string returns empty."""
         assert normalize_publish_date('   ') == ''
 
+    def test_us_datetime_format(self):
+        """Test US format is tried after European format fails."""
+        result = normalize_publish_date('12/28/2024 10:30:00')
+        assert result == '2024-12-28T10:30:00+00:00'
+
+    def test_iso_with_microseconds_without_tz(self):
+        """Test ISO string with microseconds gets UTC."""
+        result = normalize_publish_date('2024-12-28T10:30:00.123456')
+        assert result == '2024-12-28T10:30:00.123456+00:00'
+
+    def test_iso_with_negative_offset(self):
+        """Test ISO string with a negative offset keeps the offset."""
+        assert normalize_publish_date('2024-12-28T10:30:00-0500') == '2024-12-28T10:30:00-05:00'
+        assert normalize_publish_date('2024-12-28T10:30:00-05:00') == '2024-12-28T10:30:00-05:00'
+
 
 class TestScraperConfigConstants:
     """Tests for scraper configuration constants."""
@@ -660,3 +676,23 @@ class TestOutputFileConstants:
         expected_standalone = 'scraped_articles.json'
         assert expected_api.endswith('.json')
         assert expected_standalone.endswith('.json')
+
+
+class TestIterSessionArticleUrls:
+    """Tests for iter_session_article_urls function."""
+
+    def test_url_field_precedence_and_missing(self):
+        """Test url, then link, then original_url; articles without any are skipped."""
+        data = {'articles': [
+            {'url': 'https://a.com/1', 'link': 'https://ignored.com'},
+            {'link': 'https://b.com/2'},
+            {'original_url': 'https://c.com/3'},
+            {'title': 'no url'},
+        ]}
+        assert list(iter_session_article_urls(data)) == [
+            'https://a.com/1', 'https://b.com/2', 'https://c.com/3'
+        ]
+
+    def test_missing_articles_key(self):
+        """Test session data without articles yields nothing."""
+        assert list(iter_session_article_urls({})) == []
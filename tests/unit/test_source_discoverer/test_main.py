@@ -1,5 +1,6 @@
 """Unit tests for source_discoverer_function/main.py."""
 
+import json
 import pytest
 from unittest.mock import MagicMock, patch
 import sys
@@ -16,6 +17,9 @@ with patch.dict('os.environ', {'ENVIRONMENT': 'local'}):
     from source_discoverer_function.main import (
         extract_fqdn,
         extract_unique_fqdns,
+        append_discovered_sources,
+        download_json_if_exists,
+        APPEND_MAX_ATTEMPTS,
         DISCOVERED_SOURCES_PATH,
         USER_PREFERENCES_PREFIX,
     )
@@ -281,3 +285,166 @@ class TestPathConstantsFormat:
     def test_user_preferences_in_config(self):
         """Test user preferences is in config folder."""
         assert USER_PREFERENCES_PREFIX.startswith('config/')
+
+
+class TestAppendDiscoveredSources:
+    """Tests for append_discovered_sources conditional writes."""
+
+    class _PreconditionFailed(Exception):
+        code = 412
+
+    def _existing_blob(self, generation=7, fqdns=('old.com',)):
+        blob = MagicMock()
+        blob.generation = generation
+        blob.download_as_text.return_value = json.dumps({
+            'discovered': [{'fqdn': fqdn, 'first_seen': 'x'} for fqdn in fqdns],
+            'last_updated': 'x'
+        })
+        return blob
+
+    def test_creates_file_only_if_absent(self):
+        """Test new file is written with if_generation_match=0."""
+        with patch('source_discoverer_function.main.storage_client') as mock_client:
+            bucket = mock_client.bucket.return_value
+            bucket.get_blob.return_value = None
+            new_blob = bucket.blob.return_value
+
+            assert append_discovered_sources({'new.com'}) is True
+
+        kwargs = new_blob.upload_from_string.call_args[1]
+        assert kwargs['if_generation_match'] == 0
+        written = json.loads(new_blob.upload_from_string.call_args[0][0])
+        assert [e['fqdn'] for e in written['discovered']] == ['new.com']
+
+    def test_appends_with_read_generation(self):
+        """Test update is conditional on the generation that was read."""
+        with patch('source_discoverer_function.main.storage_client') as mock_client:
+            blob = self._existing_blob(generation=7)
+            mock_client.bucket.return_value.get_blob.return_value = blob
+
+            assert append_discovered_sources({'new.com'}) is True
+
+        assert blob.upload_from_string.call_args[1]['if_generation_match'] == 7
+        written = json.loads(blob.upload_from_string.call_args[0][0])
+        assert [e['fqdn'] for e in written['discovered']] == ['old.com', 'new.com']
+
+    def test_retries_on_precondition_failure(self):
+        """Test concurrent modification triggers a re-read and retry."""
+        with patch('source_discoverer_function.main.storage_client') as mock_client:
+            stale = self._existing_blob(generation=1)
+            stale.upload_from_string.side_effect = self._PreconditionFailed()
+            fresh = self._existing_blob(generation=2)
+            mock_client.bucket.return_value.get_blob.side_effect = [stale, fresh]
+
+            assert append_discovered_sources({'new.com'}) is True
+
+        assert fresh.upload_from_string.call_args[1]['if_generation_match'] == 2
+
+    def test_retry_skips_fqdns_added_concurrently(self):
+        """Test FQDNs appended by a concurrent run are not appended again."""
+        with patch('source_discoverer_function.main.storage_client') as mock_client:
+            stale = self._existing_blob(generation=1)
+            stale.upload_from_string.side_effect = self._PreconditionFailed()
+            fresh = self._existing_blob(generation=2, fqdns=('old.com', 'a.com'))
+            mock_client.bucket.return_value.get_blob.side_effect = [stale, fresh]
+
+            assert append_discovered_sources({'a.com', 'b.com'}) is True
+
+        written = json.loads(fresh.upload_from_string.call_args[0][0])
+        assert [e['fqdn'] for e in written['discovered']] == ['old.com', 'a.com', 'b.com']
+
+    def test_no_write_when_all_already_present(self):
+        """Test nothing is written once every FQDN is already discovered."""
+        with patch('source_discoverer_function.main.storage_client') as mock_client:
+            blob = self._existing_blob(fqdns=('old.com', 'a.com'))
+            mock_client.bucket.return_value.get_blob.return_value = blob
+
+            assert append_discovered_sources({'a.com'}) is True
+
+        blob.upload_from_string.assert_not_called()
+
+    def test_gives_up_after_max_attempts(self):
+        """Test persistent conflicts return False."""
+        with patch('source_discoverer_function.main.storage_client') as mock_client:
+            blob = self._existing_blob()
+            blob.upload_from_string.side_effect = self._PreconditionFailed()
+            mock_client.bucket.return_value.get_blob.return_value = blob
+
+            assert append_discovered_sources({'new.com'}) is False
+
+        assert blob.upload_from_string.call_count == APPEND_MAX_ATTEMPTS
+
+
+class TestDownloadJsonIfExists:
+    """Tests for download_json_if_exists."""
+
+    class _NotFound(Exception):
+        code = 404
+
+    def test_returns_parsed_content(self):
+        """Test existing blob is parsed without an exists() call."""
+        blob = MagicMock()
+        blob.download_as_bytes.return_value = b'{"discovered": []}'
+        assert download_json_if_exists(blob) == {'discovered': []}
+        blob.exists.assert_not_called()
+
+    def test_missing_blob_returns_none(self):
+        """Test 404 is treated as missing."""
+        blob = MagicMock()
+        blob.download_as_bytes.side_effect = self._NotFound()
+        assert download_json_if_exists(blob) is None
+
+    def test_other_errors_propagate(self):
+        """Test non-404 errors are raised."""
+        blob = MagicMock()
+        blob.download_as_bytes.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            download_json_if_exists(blob)
+
+
+class TestExtractFqdnCache:
+    """Tests for extract_fqdn memoization."""
+
+    def test_repeated_url_hits_cache(self):
+        """Test repeated URLs are served from the cache."""
+        extract_fqdn.cache_clear()
+
+        extract_fqdn("https://www.example.com/a")
+        result = extract_fqdn("https://www.example.com/a")
+
+        assert result == "example.com"
+        assert extract_fqdn.cache_info().hits == 1
+
+
+class TestProcessDiscoveryRequest:
+    """Tests for _process_discovery_request filtering order."""
+
+    def _run(self, articles, discovered):
+        from source_discoverer_function import main as discoverer
+
+        def read_json(path):
+            return {'articles': articles} if path.endswith('complete_articles.json') else {}
+
+        with patch.object(discoverer, 'read_gcs_json', side_effect=read_json), \
+             patch.object(discoverer, 'load_discovered_fqdns', return_value=discovered), \
+             patch.object(discoverer, 'load_known_fqdns_from_preferences', return_value={'known.com'}) as load_known, \
+             patch.object(discoverer, 'append_discovered_sources') as append:
+            discoverer._process_discovery_request({'run_path': 'ingestion/2025-01-01/10-00-00'})
+        return load_known, append
+
+    def test_skips_preferences_scan_when_all_discovered(self):
+        """Test user preferences are not read once nothing new remains."""
+        load_known, append = self._run([{'url': 'https://seen.com/a'}], {'seen.com'})
+
+        load_known.assert_not_called()
+        append.assert_not_called()
+
+    def test_appends_only_new_fqdns(self):
+        """Test known and discovered FQDNs are both filtered out."""
+        load_known, append = self._run(
+            [{'url': 'https://seen.com/a'}, {'url': 'https://known.com/b'}, {'url': 'https://new.com/c'}],
+            {'seen.com'}
+        )
+
+        load_known.assert_called_once()
+        append.assert_called_once_with({'new.com'})
@@ -13,7 +13,6 @@ This script compares:
 
 import os
 import sys
-import glob
 import json
 import re
 from pathlib import Path
@@ -58,6 +57,26 @@ def count_article_ids_in_jsonl(file_path: str) -> int:
         return 0
 
 
+def list_entries(path: str, prefix: str = "", suffix: str = "", dirs: bool = False) -> List[str]:
+    """
+    List entry paths in a directory matching a name prefix/suffix.
+
+    Uses os.scandir so the type check comes from the directory entry itself
+    instead of a stat() per name (os.listdir + isdir) or fnmatch (glob).
+    A missing directory yields no entries, so callers need no exists() probe.
+    """
+    try:
+        with os.scandir(path) as it:
+            return [
+                entry.path for entry in it
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(suffix)
+                and (entry.is_dir() if dirs else entry.is_file())
+            ]
+    except FileNotFoundError:
+        return []
+
+
 def analyze_batch_folder(run_folder: str) -> Dict[str, Dict]:
     """Analyze all batch input/output files in a run folder."""
     
@@ -69,18 +88,12 @@ def analyze_batch_folder(run_folder: str) -> Dict[str, Dict]:
         return results
     
     # Find all source types (complete, scraped_incomplete)
-    source_types = [d for d in os.listdir(batch_base) 
-                    if os.path.isdir(os.path.join(batch_base, d))]
-    
-    for source_type in source_types:
-        source_path = os.path.join(batch_base, source_type)
+    for source_path in list_entries(batch_base, dirs=True):
+        source_type = os.path.basename(source_path)
         
         # Find all branch types (merged, singleton)
-        branch_types = [d for d in os.listdir(source_path)
-                       if os.path.isdir(os.path.join(source_path, d))]
-        
-        for branch_type in branch_types:
-            branch_path = os.path.join(source_path, branch_type)
+        for branch_path in list_entries(source_path, dirs=True):
+            branch_type = os.path.basename(branch_path)
             key = f"{source_type}/{branch_type}"
             
             results[key] = {
@@ -92,19 +105,18 @@ def analyze_batch_folder(run_folder: str) -> Dict[str, Dict]:
             
             # Count input files
             input_path = os.path.join(branch_path, "input")
-            if os.path.exists(input_path):
-                input_files = sorted(glob.glob(os.path.join(input_path, "batch_*.json")))
-                
-                for f in input_files:
-                    count = count_body_in_json(f)
-                    results[key]["input_files"].append({
-                        "file": os.path.basename(f),
-                        "count": count
-                    })
-                    results[key]["input_total"] += count
+            input_files = sorted(list_entries(input_path, prefix="batch_", suffix=".json"))
+            
+            for f in input_files:
+                count = count_body_in_json(f)
+                results[key]["input_files"].append({
+                    "file": os.path.basename(f),
+                    "count": count
+                })
+                results[key]["input_total"] += count
             
             # Count output files (prediction folders)
-            prediction_folders = glob.glob(os.path.join(branch_path, "prediction-*"))
+            prediction_folders = list_entries(branch_path, prefix="prediction-", dirs=True)
             
             for pred_folder in prediction_folders:
                 jsonl_file = os.path.join(pred_folder, "predictions.jsonl")